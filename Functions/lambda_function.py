@@ -38,6 +38,8 @@ wati_client = WATIClient(CONFIG_FILE)
 openai_client = OpenAIClient(CONFIG_FILE)
 sheets_client = GoogleSheetsClient(CONFIG_FILE)
 drive_client = GoogleDriveClient(CONFIG_FILE)
+# Build the Sheets/Drive discovery clients during init, not on the first request
+sheets_client.prewarm()
 conversation_manager = ConversationManager(openai_client, config_manager)
 
 # Initialize database client (optional - continues without it)
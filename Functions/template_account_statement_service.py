@@ -6,19 +6,265 @@ Supports both single and multiple contract ID statements.
 Uses Google Drive to create working copies, fill data, export as PDF, and share.
 """
 
+import calendar
+import json
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
 from io import BytesIO
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Tuple
-import gspread, requests
-import os
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import pandas as pd
+except ImportError:  # optional, only speeds up filtering of very large sheets
+    pd = None
+
+try:
+    import orjson
+except ImportError:  # optional, only speeds up serializing large batchUpdate bodies
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-# Path relative to this Python file
-json_path = os.path.join(os.path.dirname(__file__), "smart-rental-478516-a8bff3c083a8.json")
-gc = gspread.service_account(filename=json_path)
+# Keep-alive session for the raw Google API calls (export, trash, batchUpdate)
+# so the TLS handshake happens once per process rather than per request
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+
+def _json_body(payload) -> bytes:
+    """Serialize a request body compactly (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+# Postcode formats in priority order (the first format found anywhere wins, so a
+# 6-digit unit/phone number never beats a 5-digit postcode later in the address).
+# The plain 5-digit format is covered by the US one.
+_POSTCODE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b\d{5}(?:-\d{4})?\b',  # US: 12345 or 12345-6789
+    r'\b[A-Z]{1,2}\d{1,2}[A-Z]?\s?\d[A-Z]{2}\b',  # UK: SW1A 1AA
+    r'\b\d{6}\b',  # 6-digit postcode
+))
+_ADDRESS_SPLIT_RE = re.compile(r'[,\n]+')
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Top-left cell of an A1 range, e.g. "Single!G18:H18" -> ("G", "18")
+_A1_START_RE = re.compile(r'!\$?([A-Z]+)\$?(\d+)')
+
+
+def _string_cell(value) -> Dict:
+    """CellData for a text column (blank values clear the cell)."""
+    if value is None or value == '':
+        return {}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+
+def _number_cell(value) -> Dict:
+    """CellData for a numeric column (blank values clear the cell)."""
+    if value is None or value == '':
+        return {}
+    return {'userEnteredValue': {'numberValue': value}}
+
+
+# Column types of the Single template's detail block (A-H), used to build
+# CellData without per-cell type checks
+_SINGLE_DETAIL_CELLS = (
+    _string_cell,  # A date
+    _string_cell,  # B invoice / receipt no. + status
+    _string_cell,  # C
+    _string_cell,  # D
+    _number_cell,  # E invoiced
+    _number_cell,  # F paid
+    _number_cell,  # G running balance
+    _string_cell,  # H planet points
+)
+
+
+@lru_cache(maxsize=256)
+def _a1_start(rng: str) -> Tuple[int, int]:
+    """
+    Get the 0-based (row, column) of the top-left cell of an A1 range.
+
+    Template ranges repeat from one statement to the next, so each one is
+    parsed once per process.
+
+    Args:
+        rng: A1 range, e.g. "Single!I10:I14"
+
+    Returns:
+        (row_index, column_index) tuple, e.g. (9, 8)
+    """
+    col_letters, row_number = _A1_START_RE.search(rng).groups()
+    column_index = 0
+    for letter in col_letters:
+        column_index = column_index * 26 + (ord(letter) - ord('A') + 1)
+    return int(row_number) - 1, column_index - 1
+
+
+# DD/MM/YYYY (as produced by normalize_date in fill_single_template)
+_DMY_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+
+@lru_cache(maxsize=1024)
+def _normalize_date(val: str) -> str:
+    """Turn a YYYY-MM month into 01/MM/YYYY; other strings pass through."""
+    if len(val) == 7 and val.count('-') == 1:
+        year, month = val.split('-')
+        return f"01/{month}/{year}"
+    return val
+
+
+@lru_cache(maxsize=1024)
+def _date_sort_key(val: str) -> Tuple[int, int, int]:
+    """(year, month, day) of a DD/MM/YYYY string; (0, 0, 0) sorts unparseable/invalid dates first."""
+    match = _DMY_RE.match(val)
+    if not match:
+        return (0, 0, 0)
+    day, month, year = (int(g) for g in match.groups())
+    if not (1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]):
+        return (0, 0, 0)
+    return (year, month, day)
+
+
+@lru_cache(maxsize=1024)
+def _parse_amount(val: str) -> float:
+    """float() of an amount string, memoized (raises ValueError like float())."""
+    return float(val)
+
+
+@lru_cache(maxsize=1024)
+def _split_address(address: str) -> Tuple[str, str, str]:
+    """
+    Regex-based split of an address into 3 lines with the postcode on line 3.
+
+    Args:
+        address: Full delivery address string
+
+    Returns:
+        Tuple of (line1, line2, line3)
+    """
+    # Try to find postcode
+    postcode = ''
+    postcode_match = next(filter(None, (p.search(address) for p in _POSTCODE_PATTERNS)), None)
+    if postcode_match:
+        postcode = postcode_match.group().strip()
+
+    # Remove postcode from address for splitting
+    address_without_postcode = address
+    if postcode_match:
+        address_without_postcode = address[:postcode_match.start()] + address[postcode_match.end():]
+
+    # Split by common delimiters
+    parts = _ADDRESS_SPLIT_RE.split(address_without_postcode)
+    parts = [p.strip() for p in parts if p.strip()]
+
+    # Distribute into 3 lines
+    if len(parts) == 0:
+        line1 = ''
+        line2 = ''
+    elif len(parts) == 1:
+        line1 = parts[0]
+        line2 = ''
+    elif len(parts) == 2:
+        line1 = parts[0]
+        line2 = parts[1]
+    else:
+        # More than 2 parts - combine all remaining parts into line2
+        line1 = parts[0]
+        line2 = ', '.join(parts[1:])
+
+    # Line 3 starts with postcode
+    line3 = postcode if postcode else ''
+
+    return (line1, line2, line3)
+
+
+# "Account Statement", "Account Statement (2)", ... (but not the summarised tab)
+_DETAIL_SHEET_RE = re.compile(r'^Account Statement(?: \(\d+\))?$')
+
+
+@lru_cache(maxsize=32)
+def _parse_headers(headers: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """
+    Normalize a sheet header row once per distinct schema.
+
+    Returns:
+        Tuple of (lower-cased headers, {lower-cased header: column index}).
+        The dict is shared between callers and must not be modified.
+    """
+    headers_lc = tuple(h.strip().lower() for h in headers)
+    return headers_lc, {h: idx for idx, h in enumerate(headers_lc)}
+
+
+# Sheets at least this long are filtered with pandas (when installed)
+PANDAS_MIN_ROWS = 10000
+
+
+def _rows_matching(rows: List[List], col_idx: int, wanted: set) -> List[List]:
+    """
+    Return the rows whose cell at col_idx, stripped and lower-cased, is in `wanted`.
+
+    Large sheets are filtered with vectorized pandas string ops; otherwise (or
+    without pandas) a plain comprehension is used. Rows too short to have the
+    column never match.
+    """
+    if pd is not None and len(rows) >= PANDAS_MIN_ROWS:
+        frame = pd.DataFrame(rows)
+        if col_idx not in frame.columns:
+            return []
+        col = frame[col_idx]
+        mask = col.notna() & col.astype(str).str.strip().str.lower().isin(wanted)
+        return [rows[i] for i in mask.to_numpy().nonzero()[0]]
+
+    return [row for row in rows if len(row) > col_idx and str(row[col_idx]).strip().lower() in wanted]
+
+
+def _group_by_contract(details: List[Dict], contract_ids: List[str]) -> Dict[str, List[Dict]]:
+    """Split detail rows into {contract_id: rows}, matching IDs stripped and lower-cased."""
+    grouped = {cid: [] for cid in contract_ids}
+    by_key = {cid.strip().lower(): grouped[cid] for cid in contract_ids}
+    for detail in details:
+        bucket = by_key.get(str(detail.get("contract id", "")).strip().lower())
+        if bucket is not None:
+            bucket.append(detail)
+    return grouped
+
+
+class _SheetCache:
+    """Thread-safe TTL cache of raw sheet rows keyed by (sheet_id, range)."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, List[List]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sheet_id: str, rng: str) -> Optional[List[List]]:
+        with self._lock:
+            entry = self._entries.get((sheet_id, rng))
+            if entry is None:
+                return None
+            if time.time() >= entry[0]:
+                del self._entries[(sheet_id, rng)]
+                return None
+            return entry[1]
+
+    def set(self, sheet_id: str, rng: str, data: List[List]):
+        with self._lock:
+            self._entries[(sheet_id, rng)] = (time.time() + self.ttl, data)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
 
 
 class TemplateAccountStatementService:
@@ -29,6 +275,11 @@ class TemplateAccountStatementService:
     MULTI_TEMPLATE_SHEET = "Multi"
     SINGLE_TEMPLATE_SHEET = "Single"
     
+    # Per-statement templates. When these point at single-tab copies of the
+    # template, the working copy needs no tab deletion.
+    TEMPLATE_SINGLE_ID = TEMPLATE_SHEET_ID
+    TEMPLATE_MULTI_ID = TEMPLATE_SHEET_ID
+    
     # Working folder for temporary copies
     WORKING_FOLDER_ID = "104lrYw0k_ohnPCFCpFGhnBktSekP_8MN"
     
@@ -40,6 +291,18 @@ class TemplateAccountStatementService:
     # Contract Report data source
     CONTRACT_REPORT_SHEET_ID = "17kaq3n07ZUknm2OgpvMfoaoXU3tuuRxQCC1ChwHDlEk"
     CONTRACT_REPORT_SHEET = "Contract Report"
+
+    # Max concurrent Sheets reads while gathering statement data
+    DATA_FETCH_WORKERS = 5
+
+    # How long (seconds) source sheet data is reused across statements
+    SHEET_CACHE_TTL = 60
+
+    # Max number of OpenAI-parsed delivery addresses kept in memory
+    ADDRESS_CACHE_SIZE = 1024
+
+    # Chunk size (bytes) when streaming the PDF export
+    PDF_CHUNK_SIZE = 64 * 1024
     
     def __init__(self, sheets_client, drive_client, openai_client=None):
         """
@@ -53,6 +316,14 @@ class TemplateAccountStatementService:
         self.sheets_client = sheets_client
         self.drive_client = drive_client
         self.openai_client = openai_client
+        # Raw source sheet rows shared by back-to-back statements
+        self._sheet_cache = _SheetCache(self.SHEET_CACHE_TTL)
+        # LRU of OpenAI address parses: {address: (line1, line2, line3)}
+        self._address_cache: "OrderedDict[str, Tuple[str, str, str]]" = OrderedDict()
+        self._address_cache_lock = threading.Lock()
+        # Tab name -> sheetId per working copy: {spreadsheet_id: {title: sheet_id}}
+        self._sheet_id_cache: Dict[str, Dict[str, int]] = {}
+        self._sheet_id_lock = threading.Lock()
         logger.info("TemplateAccountStatementService initialized")
     
     def generate_single_statement(self, contract_id: str) -> Optional[str]:
@@ -66,61 +337,67 @@ class TemplateAccountStatementService:
             PDF URL or None if failed
         """
         try:
-            logger.info(f"Generating single contract statement for: {contract_id}")
-            
-            # Collect data
-            contract_data = self.get_contract_data([contract_id])
-            if not contract_data:
-                logger.error(f"No contract data found for {contract_id}")
-                return None
-            
-            contract_info = contract_data[0]
+            logger.info("Generating single contract statement for: %s", contract_id)
             
-            summary_data = self.get_account_summary_data([contract_id])
-            detail_data = self.get_account_detail_data([contract_id])
-            point_data = self.get_planet_points_data([contract_id])
-
-            
-            # Get total planet points (try customer name first, then company name)
-            user_name = contract_info.get('customer_name') or contract_info.get('company_name', '')
-            total_planet_points = self.get_total_planet_points(user_name)
-            
-            # Create working copy of template
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             working_copy_name = f"Statement_Single_{contract_id}_{timestamp}"
             
-            working_copy_result = self.drive_client.copy_file(
-                file_id=self.TEMPLATE_SHEET_ID,
-                new_name=working_copy_name,
-                parent_folder_id=self.WORKING_FOLDER_ID
+            # Collect data (independent reads run concurrently); the template copy
+            # doesn't depend on the data, so it runs alongside the reads
+            with ThreadPoolExecutor(max_workers=self.DATA_FETCH_WORKERS) as executor:
+                copy_future = executor.submit(
+                    self._create_working_copy, working_copy_name, self.TEMPLATE_SINGLE_ID
+                )
+                contract_future = executor.submit(self.get_contract_data, [contract_id])
+                account_future = executor.submit(self._batch_read_account_sheets)
+                detail_future = executor.submit(self.get_account_detail_data, [contract_id])
+
+                contract_data = contract_future.result()
+                if not contract_data:
+                    logger.error("No contract data found for %s", contract_id)
+                    self._discard_working_copy(copy_future)
+                    return None
+
+                contract_info = contract_data[0]
+                account_data = account_future.result()
+                detail_data = detail_future.result()
+                working_copy_id = copy_future.result()
+
+            summary_data = self.get_account_summary_data(
+                [contract_id], prefetched=account_data.get('summary')
+            )
+            point_data = self.get_planet_points_data(
+                [contract_id], prefetched=account_data.get('planet_point')
             )
 
-            if not working_copy_result or 'id' not in working_copy_result:
-                logger.error("Failed to create working copy")
-                return None
-
-            working_copy_id = working_copy_result['id']
-            logger.info(f"Created working copy: {working_copy_id}")
+            # Get total planet points (try customer name first, then company name)
+            user_name = contract_info.get('customer_name') or contract_info.get('company_name', '')
+            total_planet_points = self.get_total_planet_points(
+                user_name, prefetched=account_data.get('planet_point')
+            )
             
-            # Delete unused Multi sheet tab
-            self.delete_sheet_tab(working_copy_id, self.MULTI_TEMPLATE_SHEET)
+            if not working_copy_id:
+                return None
             
-            # Fill template with data
-            self.fill_single_template(
+            # Fill template with data; a rejected fill leaves the template blank,
+            # so never export it
+            if not self.fill_single_template(
                 working_copy_id,
                 contract_info,
                 summary_data,
                 detail_data,
                 point_data,
                 total_planet_points
-            )
+            ):
+                logger.error("Failed to fill single template, not exporting")
+                self.cleanup_working_copy(working_copy_id)
+                return None
 
-            # Export as PDF bytes (with gridlines hidden)
-            pdf_bytes = self.export_sheet_as_pdf(working_copy_id, self.SINGLE_TEMPLATE_SHEET)
+            # Export as PDF bytes (with gridlines hidden), then trash the working copy
+            pdf_bytes = self.batch_finalize(working_copy_id, self.SINGLE_TEMPLATE_SHEET)
             
             if not pdf_bytes:
                 logger.error("Failed to export PDF")
-                # Note: GoogleDriveClient doesn't have delete_file method - skipping cleanup
                 return None
             
             # Upload PDF to Drive
@@ -132,9 +409,6 @@ class TemplateAccountStatementService:
                 mime_type='application/pdf'
             )
             
-            # Delete working copy spreadsheet
-            self.cleanup_working_copy(working_copy_id)
-            
             if not pdf_file_id:
                 logger.error("Failed to upload PDF")
                 return None
@@ -143,12 +417,12 @@ class TemplateAccountStatementService:
             pdf_url = self.drive_client.get_file_link(pdf_file_id)
             
             if pdf_url:
-                logger.info(f"Single statement PDF generated: {pdf_url}")
+                logger.info("Single statement PDF generated: %s", pdf_url)
             
             return pdf_url
             
         except Exception as e:
-            logger.error(f"Error generating single statement: {e}", exc_info=True)
+            logger.error("Error generating single statement: %s", e, exc_info=True)
             return None
     
     def generate_multi_statement(self, contract_ids: List[str]) -> Optional[str]:
@@ -162,59 +436,67 @@ class TemplateAccountStatementService:
             PDF URL or None if failed
         """
         try:
-            logger.info(f"Generating multi-contract statement for: {contract_ids}")
+            logger.info("Generating multi-contract statement for: %s", contract_ids)
             
-            # Collect data
-            contracts_data = self.get_contract_data(contract_ids)
-            if not contracts_data:
-                logger.error("No contract data found")
-                return None
-            
-            summary_data = self.get_account_summary_data(contract_ids)
-            details_by_contract = {}
-            for cid in contract_ids:
-                details_by_contract[cid] = self.get_account_detail_data([cid])
+            # The working copy is trashed after export, so it is named by contract
+            # rather than customer (which isn't known until the reads finish)
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            working_copy_name = f"Statement_Multi_{contract_ids[0]}_{timestamp}"
             
+            # Collect data (independent reads run concurrently); the template copy
+            # doesn't depend on the data, so it runs alongside the reads
+            with ThreadPoolExecutor(max_workers=self.DATA_FETCH_WORKERS) as executor:
+                copy_future = executor.submit(
+                    self._create_working_copy, working_copy_name, self.TEMPLATE_MULTI_ID
+                )
+                contracts_future = executor.submit(self.get_contract_data, contract_ids)
+                account_future = executor.submit(self._batch_read_account_sheets)
+                # One read of the detail tabs for every contract, split up below
+                details_future = executor.submit(self.get_account_detail_data, contract_ids)
+
+                contracts_data = contracts_future.result()
+                if not contracts_data:
+                    logger.error("No contract data found")
+                    self._discard_working_copy(copy_future)
+                    return None
+
+                account_data = account_future.result()
+                details_by_contract = _group_by_contract(details_future.result(), contract_ids)
+                working_copy_id = copy_future.result()
+
+            summary_data = self.get_account_summary_data(
+                contract_ids, prefetched=account_data.get('summary')
+            )
+
             # Get planet points using first contract's customer name
             user_name = contracts_data[0].get('customer_name') or contracts_data[0].get('company_name', '')
-            total_planet_points = self.get_total_planet_points(user_name)
+            total_planet_points = self.get_total_planet_points(
+                user_name, prefetched=account_data.get('planet_point')
+            )
             
-            # Create working copy of template
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             customer_name_safe = (user_name[:20].replace(' ', '_').replace('/', '_'))
-            working_copy_name = f"Statement_Multi_{customer_name_safe}_{timestamp}"
             
-            working_copy_result = self.drive_client.copy_file(
-                file_id=self.TEMPLATE_SHEET_ID,
-                new_name=working_copy_name,
-                parent_folder_id=self.WORKING_FOLDER_ID
-            )
-
-            if not working_copy_result or 'id' not in working_copy_result:
-                logger.error("Failed to create working copy")
+            if not working_copy_id:
                 return None
-
-            working_copy_id = working_copy_result['id']
-            logger.info(f"Created working copy: {working_copy_id}")
             
-            # Delete unused Single sheet tab
-            self.delete_sheet_tab(working_copy_id, self.SINGLE_TEMPLATE_SHEET)
-            
-            # Fill template with data
-            self.fill_multi_template(
+            # Fill template with data; a rejected fill leaves the template blank,
+            # so never export it
+            if not self.fill_multi_template(
                 working_copy_id,
                 contracts_data,
                 summary_data,
                 details_by_contract,
                 total_planet_points
-            )
+            ):
+                logger.error("Failed to fill multi template, not exporting")
+                self.cleanup_working_copy(working_copy_id)
+                return None
 
-            # Export as PDF bytes (with gridlines hidden)
-            pdf_bytes = self.export_sheet_as_pdf(working_copy_id, self.MULTI_TEMPLATE_SHEET)
+            # Export as PDF bytes (with gridlines hidden), then trash the working copy
+            pdf_bytes = self.batch_finalize(working_copy_id, self.MULTI_TEMPLATE_SHEET)
             
             if not pdf_bytes:
                 logger.error("Failed to export PDF")
-                # Note: GoogleDriveClient doesn't have delete_file method - skipping cleanup
                 return None
             
             # Upload PDF to Drive
@@ -226,9 +508,6 @@ class TemplateAccountStatementService:
                 mime_type='application/pdf'
             )
             
-            # Delete working copy spreadsheet
-            self.cleanup_working_copy(working_copy_id)
-            
             if not pdf_file_id:
                 logger.error("Failed to upload PDF")
                 return None
@@ -237,14 +516,128 @@ class TemplateAccountStatementService:
             pdf_url = self.drive_client.get_file_link(pdf_file_id)
             
             if pdf_url:
-                logger.info(f"Multi statement PDF generated: {pdf_url}")
+                logger.info("Multi statement PDF generated: %s", pdf_url)
             
             return pdf_url
             
         except Exception as e:
-            logger.error(f"Error generating multi statement: {e}", exc_info=True)
+            logger.error("Error generating multi statement: %s", e, exc_info=True)
             return None
     
+    def _create_working_copy(self, name: str, template_id: str) -> Optional[str]:
+        """
+        Copy a template into the working folder.
+
+        Args:
+            name: Name for the working copy
+            template_id: Template spreadsheet to copy
+
+        Returns:
+            Working copy spreadsheet ID or None if the copy failed
+        """
+        working_copy_result = self.drive_client.copy_file(
+            file_id=template_id,
+            new_name=name,
+            parent_folder_id=self.WORKING_FOLDER_ID
+        )
+
+        if not working_copy_result or 'id' not in working_copy_result:
+            logger.error("Failed to create working copy")
+            return None
+
+        working_copy_id = working_copy_result['id']
+        logger.info("Created working copy: %s", working_copy_id)
+        return working_copy_id
+    
+    def _discard_working_copy(self, copy_future):
+        """
+        Trash a working copy that turned out not to be needed, once its copy finishes.
+
+        Runs before the handler returns: a Lambda environment is frozen right
+        after, so background work would never get to trash the copy.
+
+        Args:
+            copy_future: Future returned for _create_working_copy
+        """
+        try:
+            working_copy_id = copy_future.result()
+        except Exception as e:
+            logger.warning("Working copy failed, nothing to discard: %s", e)
+            return
+        if working_copy_id:
+            self.cleanup_working_copy(working_copy_id)
+    
+    def _summary_range(self) -> str:
+        return f"{self.ACCOUNT_SUMMARY_SHEET}!A:J"
+
+    def _planet_point_range(self) -> str:
+        return f"{self.PLANET_POINT_SHEET}!A:G"
+
+    def _cached_read(self, sheet_id: str, rng: str) -> List[List]:
+        """
+        Read a range, reusing rows fetched within the last SHEET_CACHE_TTL seconds.
+
+        Args:
+            sheet_id: Spreadsheet ID
+            rng: A1 range including sheet name
+
+        Returns:
+            List of rows (empty if nothing could be read)
+        """
+        data = self._sheet_cache.get(sheet_id, rng)
+        if data is not None:
+            return data
+
+        data = self.sheets_client.read_range(rng, sheet_id=sheet_id, use_cache=False)
+        if data:
+            self._sheet_cache.set(sheet_id, rng, data)
+        return data
+
+    def _cached_batch_read(self, sheet_id: str, ranges: List[str]) -> Dict[str, List[List]]:
+        """
+        Batch read several ranges, only fetching the ones not already cached.
+
+        Args:
+            sheet_id: Spreadsheet ID
+            ranges: A1 ranges including sheet names
+
+        Returns:
+            Dictionary mapping range string to rows
+        """
+        result = {}
+        missing = []
+        for rng in ranges:
+            data = self._sheet_cache.get(sheet_id, rng)
+            if data is not None:
+                result[rng] = data
+            else:
+                missing.append(rng)
+
+        if missing:
+            fetched = self.sheets_client.batch_read_ranges(missing, sheet_id=sheet_id, use_cache=False)
+            for rng, data in fetched.items():
+                if data:
+                    self._sheet_cache.set(sheet_id, rng, data)
+                result[rng] = data
+
+        return result
+
+    def _batch_read_account_sheets(self) -> Dict[str, List[List]]:
+        """
+        Read the summary and Planet Point ranges of the Account Statement
+        spreadsheet in one batchGet call.
+
+        Returns:
+            Dictionary with 'summary' and 'planet_point' rows (missing on failure)
+        """
+        try:
+            ranges = {'summary': self._summary_range(), 'planet_point': self._planet_point_range()}
+            data = self._cached_batch_read(self.ACCOUNT_STATEMENT_SHEET_ID, list(ranges.values()))
+            return {key: data[rng] for key, rng in ranges.items() if rng in data}
+        except Exception as e:
+            logger.warning("Batch read of account sheets failed, falling back to single reads: %s", e)
+            return {}
+
     def get_contract_data(self, contract_ids: List[str]) -> List[Dict]:
         """
         Get contract information from Contract Report sheet.
@@ -256,19 +649,19 @@ class TemplateAccountStatementService:
             List of contract dictionaries
         """
         try:
-            logger.info(f"Fetching contract data for: {contract_ids}")
+            logger.info("Fetching contract data for: %s", contract_ids)
             
-            data = self.sheets_client.read_range(
-                f"{self.CONTRACT_REPORT_SHEET}!A:M",
-                sheet_id=self.CONTRACT_REPORT_SHEET_ID,
-                use_cache=False
+            # values.get rather than a gviz query: gviz nulls minority-type cells in
+            # mixed-type columns (e.g. IDs stored as text in a numeric column)
+            data = self._cached_read(
+                self.CONTRACT_REPORT_SHEET_ID,
+                f"{self.CONTRACT_REPORT_SHEET}!A:M"
             )
             
             if not data or len(data) < 2:
                 return []
             
-            headers = data[0]
-            header_map = {h.strip().lower(): idx for idx, h in enumerate(headers)}
+            _, header_map = _parse_headers(tuple(data[0]))
             
             # Column indices
             contract_id_idx = header_map.get("contract id")
@@ -280,39 +673,41 @@ class TemplateAccountStatementService:
             end_date_idx = header_map.get("end date")
             email_idx = header_map.get("email")
             
+            if contract_id_idx is None:
+                logger.warning("Contract ID column not found in Contract Report")
+                return []
+
             contracts = []
-            contract_ids_lower = [cid.strip().lower() for cid in contract_ids]
-            
-            for row in data[1:]:
-                if contract_id_idx and len(row) > contract_id_idx:
-                    row_contract_id = str(row[contract_id_idx]).strip().lower()
-                    
-                    if row_contract_id in contract_ids_lower:
-                        contract = {
-                            'contract_id': row[contract_id_idx] if contract_id_idx and len(row) > contract_id_idx else '',
-                            'company_name': row[company_name_idx] if company_name_idx and len(row) > company_name_idx else '',
-                            'customer_name': row[customer_name_idx] if customer_name_idx and len(row) > customer_name_idx else '',
-                            'delivery_address': row[delivery_address_idx] if delivery_address_idx and len(row) > delivery_address_idx else '',
-                            'customer_code': row[customer_code_idx] if customer_code_idx and len(row) > customer_code_idx else '',
-                            'start_date': row[start_date_idx] if start_date_idx and len(row) > start_date_idx else '',
-                            'end_date': row[end_date_idx] if end_date_idx and len(row) > end_date_idx else '',
-                            'email': row[email_idx] if email_idx and len(row) > email_idx else ''
-                        }
-                        contracts.append(contract)
-            
-            logger.info(f"Found {len(contracts)} contracts")
+            contract_ids_lower = {cid.strip().lower() for cid in contract_ids}
+            
+            for row in _rows_matching(data[1:], contract_id_idx, contract_ids_lower):
+                row_len = len(row)
+                contract = {
+                    'contract_id': row[contract_id_idx],
+                    'company_name': row[company_name_idx] if company_name_idx is not None and row_len > company_name_idx else '',
+                    'customer_name': row[customer_name_idx] if customer_name_idx is not None and row_len > customer_name_idx else '',
+                    'delivery_address': row[delivery_address_idx] if delivery_address_idx is not None and row_len > delivery_address_idx else '',
+                    'customer_code': row[customer_code_idx] if customer_code_idx is not None and row_len > customer_code_idx else '',
+                    'start_date': row[start_date_idx] if start_date_idx is not None and row_len > start_date_idx else '',
+                    'end_date': row[end_date_idx] if end_date_idx is not None and row_len > end_date_idx else '',
+                    'email': row[email_idx] if email_idx is not None and row_len > email_idx else ''
+                }
+                contracts.append(contract)
+            
+            logger.info("Found %s contracts", len(contracts))
             return contracts
             
         except Exception as e:
-            logger.error(f"Error fetching contract data: {e}", exc_info=True)
+            logger.error("Error fetching contract data: %s", e, exc_info=True)
             return []
     
-    def get_account_summary_data(self, contract_ids: List[str]) -> Dict:
+    def get_account_summary_data(self, contract_ids: List[str], prefetched: Optional[List[List]] = None) -> Dict:
         """
         Get account summary data and calculate totals.
         
         Args:
             contract_ids: List of contract IDs
+            prefetched: Optional rows already read from the summary sheet
         
         Returns:
             Dictionary with total_invoiced, total_paid, outstanding
@@ -334,19 +729,20 @@ class TemplateAccountStatementService:
                 return "RM 0.00"
 
         try:
-            logger.info(f"Fetching account summary for: {contract_ids}")
+            logger.info("Fetching account summary for: %s", contract_ids)
             
-            data = self.sheets_client.read_range(
-                f"{self.ACCOUNT_SUMMARY_SHEET}!A:J",
-                sheet_id=self.ACCOUNT_STATEMENT_SHEET_ID,
-                use_cache=False
-            )
+            if prefetched is not None:
+                data = prefetched
+            else:
+                data = self._cached_read(
+                    self.ACCOUNT_STATEMENT_SHEET_ID,
+                    self._summary_range()
+                )
             
             if not data or len(data) < 2:
                 return {'total_invoiced': "RM 0.00", 'total_paid': "RM 0.00", 'outstanding': "RM 0.00"}
             
-            headers = data[0]
-            header_map = {h.strip().lower(): idx for idx, h in enumerate(headers)}
+            _, header_map = _parse_headers(tuple(data[0]))
             
             contract_id_idx = header_map.get("contract id")
             total_invoiced_idx = header_map.get("total invoiced")
@@ -357,26 +753,24 @@ class TemplateAccountStatementService:
             total_paid = 0
             outstanding = 0
             
-            contract_ids_lower = [cid.strip().lower() for cid in contract_ids]
+            contract_ids_lower = {cid.strip().lower() for cid in contract_ids}
             
-            for row in data[1:]:
-                if contract_id_idx is not None and len(row) > contract_id_idx:
-                    row_contract_id = str(row[contract_id_idx]).strip().lower()
-                    
-                    if row_contract_id in contract_ids_lower:
+            matched_rows = _rows_matching(data[1:], contract_id_idx, contract_ids_lower) if contract_id_idx is not None else []
 
-                        # --- Replace float(...) with parse_currency(val) ---
-                        if total_invoiced_idx is not None and len(row) > total_invoiced_idx:
-                            total_invoiced += parse_currency(row[total_invoiced_idx])
+            for row in matched_rows:
+                # --- Replace float(...) with parse_currency(val) ---
+                if total_invoiced_idx is not None and len(row) > total_invoiced_idx:
+                    total_invoiced += parse_currency(row[total_invoiced_idx])
 
-                        if total_paid_idx is not None and len(row) > total_paid_idx:
-                            total_paid += parse_currency(row[total_paid_idx])
+                if total_paid_idx is not None and len(row) > total_paid_idx:
+                    total_paid += parse_currency(row[total_paid_idx])
 
-                        if outstanding_idx is not None and len(row) > outstanding_idx:
-                            outstanding += parse_currency(row[outstanding_idx])
+                if outstanding_idx is not None and len(row) > outstanding_idx:
+                    outstanding += parse_currency(row[outstanding_idx])
             
             logger.info(
-                f"Summary totals: invoiced={total_invoiced}, paid={total_paid}, outstanding={outstanding}"
+                "Summary totals: invoiced=%s, paid=%s, outstanding=%s",
+                total_invoiced, total_paid, outstanding
             )
             
             # --- Format output as "RM 0,000.00" ---
@@ -387,7 +781,7 @@ class TemplateAccountStatementService:
             }
             
         except Exception as e:
-            logger.error(f"Error fetching summary data: {e}", exc_info=True)
+            logger.error("Error fetching summary data: %s", e, exc_info=True)
             return {
                 'total_invoiced': "RM 0.00",
                 'total_paid': "RM 0.00",
@@ -405,173 +799,194 @@ class TemplateAccountStatementService:
             List of invoice detail dictionaries
         """
         try:
-            logger.info(f"Fetching account details for: {contract_ids}")
+            logger.info("Fetching account details for: %s", contract_ids)
             
             all_details = []
             # --- Get sheet metadata once ---
-            sheet_names = []
-            base_name = "Account Statement"
-
-            for i in range(1, 6):  # Allow up to "(5)" just in case
-                if i == 1:
-                    name = base_name
-                else:
-                    name = f"{base_name} ({i})"
+            sheet_names = self.get_detail_sheet_names()
+            logger.info("Detected Account Statement sheets: %s", sheet_names)
 
-                try:
-                    # Try reading header row only (faster)
-                    self.sheets_client.read_range(
-                        f"{name}!A:K",
-                        sheet_id=self.ACCOUNT_STATEMENT_SHEET_ID,
-                        use_cache=False
-                    )
-                    sheet_names.append(name)
-                except Exception:
-                    # No more sheets exist → break cleanly
-                    break
-
-            logger.info(f"Detected Account Statement sheets: {sheet_names}")
+            sheet_ranges = {name: f"{name}!A:K" for name in sheet_names}
+            sheet_data = self._cached_batch_read(
+                self.ACCOUNT_STATEMENT_SHEET_ID,
+                list(sheet_ranges.values())
+            )
             
-            contract_ids_lower = [cid.strip().lower() for cid in contract_ids]
+            contract_ids_lower = {cid.strip().lower() for cid in contract_ids}
             
             for sheet_name in sheet_names:
                 try:
-                    data = self.sheets_client.read_range(
-                        f"{sheet_name}!A:K",
-                        sheet_id=self.ACCOUNT_STATEMENT_SHEET_ID,
-                        use_cache=False
-                    )
+                    data = sheet_data.get(sheet_ranges[sheet_name])
                     
                     if not data or len(data) < 2:
                         continue
                     
-                    headers = data[0]
-                    header_map = {h.strip().lower(): idx for idx, h in enumerate(headers)}
+                    headers_lc, header_map = _parse_headers(tuple(data[0]))
+                    ncols = len(headers_lc)
                     
                     contract_id_idx = header_map.get("contract id")
                     
-                    for row in data[1:]:
-                        if contract_id_idx is not None and len(row) > contract_id_idx:
-                            row_contract_id = str(row[contract_id_idx]).strip().lower()
-                            
-                            if row_contract_id in contract_ids_lower:
-                                detail = {}
-                                for header, idx in header_map.items():
-                                    detail[header] = row[idx] if idx < len(row) else ''
-                                all_details.append(detail)
+                    if contract_id_idx is None:
+                        continue
+                    
+                    for row in _rows_matching(data[1:], contract_id_idx, contract_ids_lower):
+                        row_padded = row + [''] * (ncols - len(row)) if len(row) < ncols else row[:ncols]
+                        all_details.append(dict(zip(headers_lc, row_padded)))
                     
                 except Exception as e:
-                    logger.warning(f"Error reading {sheet_name}: {e}")
+                    logger.warning("Error reading %s: %s", sheet_name, e)
                     continue
             
-            logger.info(f"Found {len(all_details)} detail records")
+            logger.info("Found %s detail records", len(all_details))
             return all_details
             
         except Exception as e:
-            logger.error(f"Error fetching detail data: {e}", exc_info=True)
+            logger.error("Error fetching detail data: %s", e, exc_info=True)
             return []
     
-    def get_total_planet_points(self, user_name: str) -> float:
+    def _resolve_sheet_id(self, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
+        """
+        Look up the numeric sheetId (GID) of a tab, fetching the spreadsheet's
+        tabs once and reusing them for the rest of the statement run.
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            sheet_name: Tab name
+
+        Returns:
+            sheetId or None if the tab doesn't exist
+        """
+        with self._sheet_id_lock:
+            sheet_ids = self._sheet_id_cache.get(spreadsheet_id)
+
+        if sheet_ids is None:
+            sheet_ids = self.sheets_client.get_sheet_gids(spreadsheet_id)
+            if sheet_ids:
+                with self._sheet_id_lock:
+                    self._sheet_id_cache[spreadsheet_id] = sheet_ids
+
+        return sheet_ids.get(sheet_name)
+    
+    def get_detail_sheet_names(self) -> List[str]:
+        """
+        Get the Account Statement detail tab names ("Account Statement",
+        "Account Statement (2)", ...) with one tab-list metadata call, so a
+        newly added tab is picked up by the next statement.
+
+        Returns:
+            List of detail sheet names in spreadsheet order
+        """
+        sheet_gids = self.sheets_client.get_sheet_gids(self.ACCOUNT_STATEMENT_SHEET_ID)
+        return [title for title in sheet_gids if _DETAIL_SHEET_RE.match(title)]
+
+    def _load_planet_points_rows(
+        self, prefetched: Optional[List[List]] = None
+    ) -> Tuple[Tuple[str, ...], Dict[str, int], List[List]]:
+        """
+        Load the Planet Point sheet once for both the user-wide total and the
+        per-contract records (standalone calls share the TTL sheet cache).
+
+        Args:
+            prefetched: Optional rows already read from the Planet Point sheet
+
+        Returns:
+            Tuple of (lower-cased headers, header map, data rows); empty if no data
+        """
+        if prefetched is not None:
+            data = prefetched
+        else:
+            data = self._cached_read(
+                self.ACCOUNT_STATEMENT_SHEET_ID,
+                self._planet_point_range()
+            )
+
+        if not data or len(data) < 2:
+            logger.warning("Planet Point sheet is empty or not found")
+            return (), {}, []
+
+        headers_lc, header_map = _parse_headers(tuple(data[0]))
+        return headers_lc, header_map, data[1:]
+
+    def get_total_planet_points(self, user_name: str, prefetched: Optional[List[List]] = None) -> float:
         """
         Get total planet points for a *USER*.
         
         Args:
             user_name: Customer/company name to match
+            prefetched: Optional rows already read from the Planet Point sheet
         
         Returns:
             Total points (float)
         """
         try:
-            logger.info(f"Fetching planet points for: {user_name}")
-            
-            # Try to read Planet Point sheet from the same spreadsheet as Account Statement
-            data = self.sheets_client.read_range(
-                "Planet Point!A:G",
-                sheet_id=self.ACCOUNT_STATEMENT_SHEET_ID,
-                use_cache=False
-            )
+            logger.info("Fetching planet points for: %s", user_name)
             
-            if not data or len(data) < 2:
-                logger.warning("Planet Point sheet is empty or not found")
+            _, header_map, rows = self._load_planet_points_rows(prefetched)
+            if not rows:
                 return 0.0
             
-            headers = data[0]
-            header_map = {h.strip().lower(): idx for idx, h in enumerate(headers)}
             
-            user_name_idx = header_map.get("user_name") or header_map.get("customer name")
+            user_name_idx = header_map.get("user_name")
+            if user_name_idx is None:
+                user_name_idx = header_map.get("customer name")
             points_idx = header_map.get("points")
             
-            if not user_name_idx or not points_idx:
+            if user_name_idx is None or points_idx is None:
                 logger.warning("Required columns not found in Planet Point sheet")
                 return 0.0
             
             total_points = 0.0
             user_name_lower = user_name.strip().lower()
             
-            for row in data[1:]:
-                if len(row) > user_name_idx:
-                    row_user_name = str(row[user_name_idx]).strip().lower()
-                    
-                    # Exact match
-                    if row_user_name == user_name_lower:
-                        try:
-                            if len(row) > points_idx:
-                                total_points += float(row[points_idx] or 0)
-                        except (ValueError, TypeError):
-                            pass
-            
-            logger.info(f"Total planet points: {total_points}")
+            # Exact match
+            for row in _rows_matching(rows, user_name_idx, {user_name_lower}):
+                try:
+                    if len(row) > points_idx:
+                        total_points += float(row[points_idx] or 0)
+                except (ValueError, TypeError):
+                    pass
+            
+            logger.info("Total planet points: %s", total_points)
             return round(total_points, 2)
             
         except Exception as e:
-            logger.warning(f"Error fetching planet points: {e}")
+            logger.warning("Error fetching planet points: %s", e)
             return 0.0
 
-    def get_planet_points_data(self, contract_ids: List[str]) -> List[Dict]:
+    def get_planet_points_data(self, contract_ids: List[str], prefetched: Optional[List[List]] = None) -> List[Dict]:
         """
         Get Planet Points records for a *CONTRACT*.
         Args:
             contract_ids: Lists of contract IDs 
+            prefetched: Optional rows already read from the Planet Point sheet
         
         Returns:
             list of planet point dictionaries
         """
         try:
-            logger.info(f"Fetching account summary for: {contract_ids}")
+            logger.info("Fetching account summary for: %s", contract_ids)
             
             all_pp_details = []
-            contract_ids_lower = [cid.strip().lower() for cid in contract_ids]
+            contract_ids_lower = {cid.strip().lower() for cid in contract_ids}
 
-            data = self.sheets_client.read_range(
-                f"{self.PLANET_POINT_SHEET}!A:G",
-                sheet_id=self.ACCOUNT_STATEMENT_SHEET_ID,
-                use_cache=False
-            )
-            
-            if not data or len(data) < 2:
-                logger.warning("Planet Point sheet is empty or not found")
+            headers_lc, header_map, rows = self._load_planet_points_rows(prefetched)
+            if not rows:
                 return []
             
-            headers = data[0]
-            header_map = {h.strip().lower(): idx for idx, h in enumerate(headers)}
+            ncols = len(headers_lc)
             
             contract_id_idx = header_map.get("contract id")
 
-            for row in data[1:]:
-                if contract_id_idx is not None and len(row) > contract_id_idx:
-                    row_contract_id = str(row[contract_id_idx]).strip().lower()
-                    
-                    if row_contract_id in contract_ids_lower:
-                        pp_detail = {}
-                        for header, idx in header_map.items():
-                            pp_detail[header] = row[idx] if idx < len(row) else ''
-                        all_pp_details.append(pp_detail)
+            if contract_id_idx is not None:
+                for row in _rows_matching(rows, contract_id_idx, contract_ids_lower):
+                    row_padded = row + [''] * (ncols - len(row)) if len(row) < ncols else row[:ncols]
+                    all_pp_details.append(dict(zip(headers_lc, row_padded)))
 
-            logger.info(f"Found {len(all_pp_details)} planet point details")
+            logger.info("Found %s planet point details", len(all_pp_details))
             return all_pp_details
 
         except Exception as e:
-            logger.error(f"Error fetching planet point detail data: {e}", exc_info=True)
+            logger.error("Error fetching planet point detail data: %s", e, exc_info=True)
             return []
 
     def parse_delivery_address(self, address: str) -> Tuple[str, str, str]:
@@ -590,6 +1005,14 @@ class TemplateAccountStatementService:
 
         # Try OpenAI parsing first if available
         if self.openai_client:
+            cache_key = address.strip()
+            with self._address_cache_lock:
+                cached = self._address_cache.get(cache_key)
+                if cached is not None:
+                    self._address_cache.move_to_end(cache_key)
+                    logger.info("Using cached OpenAI address parse")
+                    return cached
+
             try:
                 logger.info("Using OpenAI to parse delivery address")
                 prompt = f"""Parse this delivery address into exactly 3 lines following these rules:
@@ -610,74 +1033,28 @@ Return ONLY a JSON object with this exact format (no additional text):
                 )
 
                 content = response.get("content", "").strip()
-                # Try to extract JSON from response
-                import json
-                # Find JSON object in response
+                # Decode the first JSON object in the response (ignores any trailing text)
                 start_idx = content.find('{')
-                end_idx = content.rfind('}') + 1
-                if start_idx >= 0 and end_idx > start_idx:
-                    json_str = content[start_idx:end_idx]
-                    parsed = json.loads(json_str)
+                if start_idx >= 0:
+                    parsed, _ = _JSON_DECODER.raw_decode(content, start_idx)
                     line1 = parsed.get("line1", "").strip()
                     line2 = parsed.get("line2", "").strip()
                     line3 = parsed.get("line3", "").strip()
 
                     if line1 or line2 or line3:
-                        logger.info(f"OpenAI parsed address: L1={line1}, L2={line2}, L3={line3}")
+                        logger.info("OpenAI parsed address: L1=%s, L2=%s, L3=%s", line1, line2, line3)
+                        with self._address_cache_lock:
+                            self._address_cache[cache_key] = (line1, line2, line3)
+                            if len(self._address_cache) > self.ADDRESS_CACHE_SIZE:
+                                self._address_cache.popitem(last=False)
                         return (line1, line2, line3)
 
             except Exception as e:
-                logger.warning(f"OpenAI address parsing failed, falling back to regex: {e}")
+                logger.warning("OpenAI address parsing failed, falling back to regex: %s", e)
 
-        # Fallback to regex-based parsing
+        # Fallback to regex-based parsing (memoized)
         logger.info("Using regex-based address parsing")
-
-        # Postcode patterns (common formats)
-        postcode_patterns = [
-            r'\b\d{5}(?:-\d{4})?\b',  # US: 12345 or 12345-6789
-            r'\b[A-Z]{1,2}\d{1,2}[A-Z]?\s?\d[A-Z]{2}\b',  # UK: SW1A 1AA
-            r'\b\d{5}\b',  # Simple 5-digit
-            r'\b\d{6}\b',  # 6-digit postcode
-        ]
-
-        # Try to find postcode
-        postcode = ''
-        postcode_match = None
-        for pattern in postcode_patterns:
-            match = re.search(pattern, address, re.IGNORECASE)
-            if match:
-                postcode = match.group().strip()
-                postcode_match = match
-                break
-
-        # Remove postcode from address for splitting
-        address_without_postcode = address
-        if postcode_match:
-            address_without_postcode = address[:postcode_match.start()] + address[postcode_match.end():]
-
-        # Split by common delimiters
-        parts = re.split(r'[,\n]+', address_without_postcode)
-        parts = [p.strip() for p in parts if p.strip()]
-
-        # Distribute into 3 lines
-        if len(parts) == 0:
-            line1 = ''
-            line2 = ''
-        elif len(parts) == 1:
-            line1 = parts[0]
-            line2 = ''
-        elif len(parts) == 2:
-            line1 = parts[0]
-            line2 = parts[1]
-        else:
-            # More than 2 parts - combine all remaining parts into line2
-            line1 = parts[0]
-            line2 = ', '.join(parts[1:])
-
-        # Line 3 starts with postcode
-        line3 = postcode if postcode else ''
-
-        return (line1, line2, line3)
+        return _split_address(address)
     
     def fill_single_template(
         self,
@@ -687,9 +1064,13 @@ Return ONLY a JSON object with this exact format (no additional text):
         detail_data: List[Dict],
         point_data: List[Dict],
         total_planet_points: float
-    ):
+    ) -> bool:
         """
         Fill Single template with data using Google Sheets API.
+
+        The row insert and every cell write (header fields, planet point
+        summary, balance row and invoice details) go out in a single
+        spreadsheets.batchUpdate call.
         
         Args:
             spreadsheet_id: Working copy spreadsheet ID
@@ -697,208 +1078,96 @@ Return ONLY a JSON object with this exact format (no additional text):
             summary_data: Summary totals dictionary
             detail_data: List of invoice details
             total_planet_points: Total planet points
+
+        Returns:
+            True if the template was filled (the batchUpdate is all-or-nothing)
         """
         try:
-            # Prepare batch update requests
-            updates = []
-            
-            # Customer name/company name (A10)
-            customer_name = contract_info.get('customer_name') or contract_info.get('company_name', '')
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!A10',
-                'values': [[customer_name]]
-            })
-            
-            # Delivery address (A11, A12, A13)
-            address = contract_info.get('delivery_address', '')
-            line1, line2, line3 = self.parse_delivery_address(address)
-            updates.extend([
-                {'range': f'{self.SINGLE_TEMPLATE_SHEET}!A11', 'values': [[line1]]},
-                {'range': f'{self.SINGLE_TEMPLATE_SHEET}!A12', 'values': [[line2]]},
-                {'range': f'{self.SINGLE_TEMPLATE_SHEET}!A13', 'values': [[line3]]}
-            ])
+            sheet = self.SINGLE_TEMPLATE_SHEET
 
-            # Customer email (A14)
-            customer_email = f"EMAIL: {contract_info.get('email', '')}"
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!A14',
-                'values': [[customer_email]]
-            })
-            
-            # Customer code (I10)
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!I10',
-                'values': [[contract_info.get('customer_code', '')]]
-            })
-            
-            # Statement date (I11)
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!I11',
-                'values': [[datetime.now(timezone.utc).strftime("%Y-%m-%d")]]
-            })
-            
-            # Totals (I12, I13, I14)
-            updates.extend([
-                {'range': f'{self.SINGLE_TEMPLATE_SHEET}!I12', 'values': [[summary_data.get('total_invoiced', 0)]]},
-                {'range': f'{self.SINGLE_TEMPLATE_SHEET}!I13', 'values': [[summary_data.get('total_paid', 0)]]},
-                {'range': f'{self.SINGLE_TEMPLATE_SHEET}!I14', 'values': [[summary_data.get('outstanding', 0)]]}
-            ])
-            
-            # Total Planet points (D26)
-            earned_pp = f": {total_planet_points}"
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!D26',
-                'values': [[earned_pp]]
-            })
-
-            # Planet points redeemed (D27)
-            redeemed_pp = f": -"
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!D27',
-                'values': [[redeemed_pp]]
-            })
-            # Planet points expiring (D28)
-            expiring_pp = f": -"
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!D28',
-                'values': [[expiring_pp]]
-            })
-            # Planet points expired (D29)
-            expired_pp = f": -"
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!D29',
-                'values': [[expired_pp]]
-            })
-            # Planet points summary (D30)
-            sum_pp = f": {total_planet_points}"
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!D30',
-                'values': [[sum_pp]]
-            })
-            
-            # Contract header (A16)
-            contract_header = f"CONTRACT #{contract_info.get('contract_id', '')} ({contract_info.get('start_date', '')} - {contract_info.get('end_date', '')})"
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!A16',
-                'values': [[contract_header]]
-            })
-
-            # Add BALANCE + Planet Point summary row
-            updates.append({
-                'range': f'{self.SINGLE_TEMPLATE_SHEET}!G18',
-                'values': [[summary_data.get('outstanding', 0), f"{total_planet_points} PP"]]
-            })
-            
-            # Batch update all cells (except invoice details)
-            self.sheets_client.batch_update(updates, sheet_id=spreadsheet_id)
-
-            ### Create lookup map for quick access: invoice_number -> points
+            ### Create lookup map for quick access: invoice_number -> "+ 12.50 PP" label
             invoice_pp_map = {}
             if point_data:
                 for pp_row in point_data:
                     invoice_no = str(pp_row.get('invoice_number', '')).strip()
                     points = pp_row.get('points', None)
                     if invoice_no and points is not None:
-                        invoice_pp_map[invoice_no] = float(points)
+                        invoice_pp_map[invoice_no] = f"+ {float(points):.2f} PP"
 
+            no_pp = "    "  # no planet points for this invoice
 
-            ### Invoice details - insert rows after contract header row 16
-            if detail_data:
 
-                # Map Points to Inv
-                def pp(inv_no):
-                    pt = invoice_pp_map.get(inv_no.strip())
-                    if pt is None:
-                        return "    "        # no planet points for this invoice
-                    return f"+ {pt:.2f} PP"
+            ### Invoice details - rows go after contract header row 16
+            detail_rows = []
+            if detail_data:
 
-                # --- NORMALIZE DATE ---
+                # --- NORMALIZE DATE --- (month strings repeat heavily, so both are memoized)
                 def normalize_date(val):
                     if not val:
                         return ''
-                    if isinstance(val, str) and len(val) == 7 and val.count('-') == 1:
-                        # YYYY-MM → 01/MM/YYYY
-                        year, month = val.split('-')
-                        return f"01/{month}/{year}"
-                    return val
-
-                # --- PARSE & CLASSIFY ENTRIES ---
-                invoices = []
-                receipts = []
-
-                for d in detail_data:
-                    invoice_no = d.get("invoice no.", "")
-                    receipt_no = d.get("receipt no.", "")
-
-                    entry = {
-                        'invoice no': invoice_no,
-                        'receipt no': receipt_no,
-                        'month': normalize_date(d.get('month')),
-                        'invoiced amount': d.get('debit', ''),
-                        'payment status': d.get('payment status', ''),
-                        'paid at': normalize_date(d.get('paid at')),
-                        'paid amount': d.get('credit', ''),
-                        'outstanding amount': d.get('balance', '')
-                    }
-
-                    # --- FILTER OUT missing invoices ---
-                    if invoice_no == "Missing Invoice":
-                        continue
+                    if not isinstance(val, str):
+                        return val
+                    return _normalize_date(val)
 
-                    # --- CLASSIFY RECEIPTS ---
-                    if receipt_no and receipt_no != "-":
-                        receipts.append(entry)
-                    else:
-                        invoices.append(entry)
-
-
-                def date_key(x):
-                    try:
-                        return datetime.strptime(x['month'], "%d/%m/%Y")
-                    except:
-                        return datetime.min
+                def date_sort_key(val):
+                    return _date_sort_key(val) if isinstance(val, str) else (0, 0, 0)
 
-                invoices.sort(key=date_key)
-                receipts.sort(key=date_key)
+                # Debit/credit strings repeat too (same monthly amount); numbers pass straight through
+                def to_amount(val):
+                    if not val:
+                        return 0.0
+                    if isinstance(val, (int, float)):
+                        return float(val)
+                    return _parse_amount(val)
 
-                # FINAL MERGED LIST
-                sorted_details = invoices + receipts
+                # --- PARSE & CLASSIFY ENTRIES ---
+                # Columns are pulled out once per field; "Missing Invoice" rows are dropped
+                kept = [d for d in detail_data if d.get("invoice no.", "") != "Missing Invoice"]
+                invoice_nos = [d.get("invoice no.", "") for d in kept]
+                receipt_nos = [d.get("receipt no.", "") for d in kept]
+                months = [normalize_date(d.get('month')) for d in kept]
+                is_receipt = [bool(r) and r != "-" for r in receipt_nos]
 
-                # Total rows needed: detail rows + 1 balance summary row
-                #num_rows_to_insert = 2 * len(sorted_details)
+                # Invoices first, then receipts, each in date order (sorted() is stable)
+                order = sorted(range(len(kept)), key=lambda i: (is_receipt[i], date_sort_key(months[i])))
 
                 # Fill the detail rows with data (same structure as before)
-                detail_rows = []
                 running_balance = summary_data.get("opening_balance", 0)  # or 0 if none
+                add_row = detail_rows.append  # bound once; up to two rows per entry
 
-                for detail in sorted_details:
-                    invoice_no = detail.get('invoice no', '')
-                    receipt_no = detail.get('receipt no', '')
-                    invoiced = float(detail.get('invoiced amount') or 0)
-                    paid = float(detail.get('paid amount') or 0)
+                for i in order:
+                    invoice_no = invoice_nos[i]
+                    if not invoice_no:
+                        continue
+
+                    d = kept[i]
+                    invoiced = to_amount(d.get('debit'))
+                    paid = to_amount(d.get('credit'))
+                    # No planet points at all is the common case; skip the key strip + lookup
+                    pp_label = invoice_pp_map.get(str(invoice_no).strip(), no_pp) if invoice_pp_map else no_pp
 
                     # Case 1: Invoice with receipt → produce *two* rows
 
-                    if invoice_no and invoice_no != "Missing Invoice" and receipt_no and receipt_no != "-":
+                    if is_receipt[i]:
                         # Invoice row
                         running_balance += invoiced
                         invoice_row = [
-                            detail.get('month', ''),                          # A
-                            invoice_no + f"    " + detail.get('payment status', ''),  # B
+                            months[i],                                        # A
+                            invoice_no + f"    " + d.get('payment status', ''),  # B
                             "",                                               # C
                             "",                                               # D
                             invoiced,                                         # E
                             "",                                               # F
                             running_balance,                                  # G (computed)
-                            pp(invoice_no)
+                            pp_label
                         ]
-                        detail_rows.append(invoice_row)
+                        add_row(invoice_row)
 
                         # Receipt row
                         running_balance -= paid
                         receipt_row = [
-                            detail.get('paid at', ''),
-                            receipt_no + f" for " + invoice_no,
+                            normalize_date(d.get('paid at')),
+                            receipt_nos[i] + f" for " + invoice_no,
                             "",
                             "",
                             "",
@@ -906,44 +1175,97 @@ Return ONLY a JSON object with this exact format (no additional text):
                             running_balance,
                             "    "
                         ]
-                        detail_rows.append(receipt_row)
+                        add_row(receipt_row)
 
                     # Case 2: Invoice without receipt
-                    elif invoice_no and invoice_no != "Missing Invoice":
+                    else:
                         running_balance += invoiced - paid
                         row = [
-                            detail.get('month', ''),
-                            invoice_no + f"    " + detail.get('payment status', ''),
+                            months[i],
+                            invoice_no + f"    " + d.get('payment status', ''),
                             "",
                             "",
                             invoiced,
                             paid,
                             running_balance,
-                            pp(invoice_no)
+                            pp_label
                         ]
-                        detail_rows.append(row)
-
-                # Insert rows starting at row 17 (after contract header at row 16)
-                self.insert_rows_with_formatting(
-                    spreadsheet_id=spreadsheet_id,
-                    sheet_name=self.SINGLE_TEMPLATE_SHEET,
-                    start_row=18,
-                    num_rows=len(detail_rows) - 1,
-                    source_row=17  # template row already has formulas
-                )
+                        add_row(row)
 
-                # Update the data in the inserted rows
-                detail_updates = [{
-                    'range': f'{self.SINGLE_TEMPLATE_SHEET}!A17',
-                    'values': detail_rows
-                }]
-                self.sheets_client.batch_update(detail_updates, sheet_id=spreadsheet_id)
-                
+            # Rows are inserted starting at row 18 (row 17 is the template detail row).
+            # Everything at or below row 18 shifts down by the inserted count.
+            inserted_rows = max(len(detail_rows) - 1, 0)
 
-            logger.info(f"Single template filled with {len(detail_data) if detail_data else 0} rows")            
+            # Customer name/company name, delivery address and email (A10:A14)
+            customer_name = contract_info.get('customer_name') or contract_info.get('company_name', '')
+            address = contract_info.get('delivery_address', '')
+            line1, line2, line3 = self.parse_delivery_address(address)
+            customer_email = f"EMAIL: {contract_info.get('email', '')}"
+
+            # Contract header (A16)
+            contract_header = f"CONTRACT #{contract_info.get('contract_id', '')} ({contract_info.get('start_date', '')} - {contract_info.get('end_date', '')})"
+
+            updates = [
+                {
+                    'range': f'{sheet}!A10:A14',
+                    'values': [[customer_name], [line1], [line2], [line3], [customer_email]],
+                    'cells': (_string_cell,)
+                },
+                # Customer code, statement date and totals (I10:I14)
+                {
+                    'range': f'{sheet}!I10:I14',
+                    'values': [
+                        [contract_info.get('customer_code', '')],
+                        [datetime.now(timezone.utc).strftime("%Y-%m-%d")],
+                        [summary_data.get('total_invoiced', 0)],
+                        [summary_data.get('total_paid', 0)],
+                        [summary_data.get('outstanding', 0)]
+                    ]
+                },
+                # BALANCE + Planet Point summary row (template row 18); outstanding
+                # is already formatted text ("RM 6,065.28")
+                {
+                    'range': f'{sheet}!G{18 + inserted_rows}',
+                    'values': [[summary_data.get('outstanding', 0), f"{total_planet_points} PP"]],
+                    'cells': (_string_cell, _string_cell)
+                },
+                # Planet points earned / redeemed / expiring / expired / summary (template D26:D30)
+                {
+                    'range': f'{sheet}!D{26 + inserted_rows}:D{30 + inserted_rows}',
+                    'values': [
+                        [f": {total_planet_points}"],
+                        [": -"],
+                        [": -"],
+                        [": -"],
+                        [f": {total_planet_points}"]
+                    ],
+                    'cells': (_string_cell,)
+                }
+            ]
+
+            # Contract header (A16) and the detail rows below it as one block
+            updates.append({
+                'range': f'{sheet}!A16:H{16 + len(detail_rows)}',
+                'values': [[contract_header]] + detail_rows,
+                'cells': _SINGLE_DETAIL_CELLS
+            })
+
+            # Row insert and every cell write in one batchUpdate
+            filled = self.apply_template_fill(
+                spreadsheet_id=spreadsheet_id,
+                sheet_name=sheet,
+                updates=updates,
+                start_row=18,
+                num_rows=inserted_rows
+            )
+
+            if filled:
+                logger.info("Single template filled with %s rows", len(detail_data) if detail_data else 0)
+            return filled
             
         except Exception as e:
-            logger.error(f"Error filling single template: {e}", exc_info=True)
+            logger.error("Error filling single template: %s", e, exc_info=True)
+            return False
     
     def fill_multi_template(
         self,
@@ -952,7 +1274,7 @@ Return ONLY a JSON object with this exact format (no additional text):
         summary_data: Dict,
         details_by_contract: Dict[str, List[Dict]],
         total_planet_points: float
-    ):
+    ) -> bool:
         """
         Fill Multi template with data from multiple contracts using Google Sheets API.
         
@@ -962,71 +1284,33 @@ Return ONLY a JSON object with this exact format (no additional text):
             summary_data: Summary totals dictionary (summed across all contracts)
             details_by_contract: Dictionary mapping contract_id to invoice details
             total_planet_points: Total planet points
+
+        Returns:
+            True if the template was filled (the batchUpdate is all-or-nothing)
         """
         try:
             # Use first contract's info for customer details
             first_contract = contracts_data[0]
-            
-            # Prepare batch update requests
-            updates = []
-            
-            # Customer name/company name (A10)
-            customer_name = first_contract.get('customer_name') or first_contract.get('company_name', '')
-            updates.append({
-                'range': f'{self.MULTI_TEMPLATE_SHEET}!A10',
-                'values': [[customer_name]]
-            })
-            
-            # Delivery address (A11, A12, A13)
-            address = first_contract.get('delivery_address', '')
-            line1, line2, line3 = self.parse_delivery_address(address)
-            updates.extend([
-                {'range': f'{self.MULTI_TEMPLATE_SHEET}!A11', 'values': [[line1]]},
-                {'range': f'{self.MULTI_TEMPLATE_SHEET}!A12', 'values': [[line2]]},
-                {'range': f'{self.MULTI_TEMPLATE_SHEET}!A13', 'values': [[line3]]}
-            ])
-            
-            # Customer code (I10)
-            updates.append({
-                'range': f'{self.MULTI_TEMPLATE_SHEET}!I10',
-                'values': [[first_contract.get('customer_code', '')]]
-            })
-            
-            # Statement date (I11)
-            updates.append({
-                'range': f'{self.MULTI_TEMPLATE_SHEET}!I11',
-                'values': [[datetime.now(timezone.utc).strftime("%Y-%m-%d")]]
-            })
-            
-            # Summed totals (I12, I13, I14)
-            updates.extend([
-                {'range': f'{self.MULTI_TEMPLATE_SHEET}!I12', 'values': [[summary_data.get('total_invoiced', 0)]]},
-                {'range': f'{self.MULTI_TEMPLATE_SHEET}!I13', 'values': [[summary_data.get('total_paid', 0)]]},
-                {'range': f'{self.MULTI_TEMPLATE_SHEET}!I14', 'values': [[summary_data.get('outstanding', 0)]]}
-            ])
-            
-            # Planet points (D29)
-            updates.append({
-                'range': f'{self.MULTI_TEMPLATE_SHEET}!D29',
-                'values': [[total_planet_points]]
-            })
-
-            # Batch update all cells (except invoice details)
-            self.sheets_client.batch_update(updates, sheet_id=spreadsheet_id)
+            sheet = self.MULTI_TEMPLATE_SHEET
+
+            # Dynamic table starting at row 17 (rows 15/16 are the header template).
+            # Each contract takes its header row plus one row per invoice, so the
+            # 0-indexed header rows (for yellow formatting) are running offsets
+            # from 16; the last offset is the BALANCE row.
+            row_offsets = list(accumulate(
+                (len(details_by_contract.get(contract.get('contract_id', ''), [])) + 1 for contract in contracts_data),
+                initial=16
+            ))
+            contract_header_rows = row_offsets[:-1]
+            balance_row_index = row_offsets[-1]
 
-            # Dynamic table starting at row 16 (row 16 is header template)
             all_rows = []
-            contract_header_rows = []  # Track which rows are contract headers for yellow formatting
-            current_row = 17  # Start inserting at row 17
-
             for contract in contracts_data:
                 contract_id = contract.get('contract_id', '')
 
                 # Contract header row
                 contract_header = f"{contract_id} | {contract.get('start_date', '')} | {contract.get('end_date', '')}"
                 all_rows.append([contract_header, '', '', '', '', '', ''])
-                contract_header_rows.append(current_row - 1)  # Track this row index (0-indexed)
-                current_row += 1
 
                 # Invoice details for this contract
                 details = details_by_contract.get(contract_id, [])
@@ -1041,44 +1325,67 @@ Return ONLY a JSON object with this exact format (no additional text):
                         detail.get('outstanding amount', '')
                     ]
                     all_rows.append(row)
-                    current_row += 1
-
-            if all_rows:
-                # Add BALANCE summary row
-                balance_row = ['', '', '', '', 'BALANCE:', summary_data.get('outstanding', 0), total_planet_points]
-                all_rows.append(balance_row)
-                balance_row_index = current_row - 1  # Track balance row (0-indexed)
-
-                # Insert rows for all data (contracts + invoice details + balance)
-                num_rows_to_insert = len(all_rows)
-                self.insert_rows_with_formatting(
-                    spreadsheet_id=spreadsheet_id,
-                    sheet_name=self.MULTI_TEMPLATE_SHEET,
-                    start_row=17,
-                    num_rows=num_rows_to_insert,
-                    source_row=15  # Copy formatting from header row 15
-                )
 
-                # Fill the inserted rows with data
-                detail_updates = [{
-                    'range': f'{self.MULTI_TEMPLATE_SHEET}!A17',
+            # Add BALANCE summary row
+            balance_row = ['', '', '', '', 'BALANCE:', summary_data.get('outstanding', 0), total_planet_points]
+            all_rows.append(balance_row)
+
+            # Rows are inserted for all data (contracts + invoice details + balance).
+            # Everything at or below row 17 shifts down by the inserted count.
+            num_rows_to_insert = len(all_rows)
+
+            customer_name = first_contract.get('customer_name') or first_contract.get('company_name', '')
+            address = first_contract.get('delivery_address', '')
+            line1, line2, line3 = self.parse_delivery_address(address)
+
+            updates = [
+                # Customer name/company name and delivery address (A10:A13)
+                {
+                    'range': f'{sheet}!A10:A13',
+                    'values': [[customer_name], [line1], [line2], [line3]]
+                },
+                # Customer code, statement date and summed totals (I10:I14)
+                {
+                    'range': f'{sheet}!I10:I14',
+                    'values': [
+                        [first_contract.get('customer_code', '')],
+                        [datetime.now(timezone.utc).strftime("%Y-%m-%d")],
+                        [summary_data.get('total_invoiced', 0)],
+                        [summary_data.get('total_paid', 0)],
+                        [summary_data.get('outstanding', 0)]
+                    ]
+                },
+                # Planet points (template D29)
+                {
+                    'range': f'{sheet}!D{29 + num_rows_to_insert}',
+                    'values': [[total_planet_points]]
+                },
+                # Contract headers, invoice details and balance as one block
+                {
+                    'range': f'{sheet}!A17:G{16 + num_rows_to_insert}',
                     'values': all_rows
-                }]
-                self.sheets_client.batch_update(detail_updates, sheet_id=spreadsheet_id)
-
-                # Apply yellow background to contract headers and balance row
-                rows_to_highlight = contract_header_rows + [balance_row_index]
-                self.apply_row_formatting(
-                    spreadsheet_id=spreadsheet_id,
-                    sheet_name=self.MULTI_TEMPLATE_SHEET,
-                    rows_to_format=rows_to_highlight,
-                    background_color={'red': 1.0, 'green': 0.9, 'blue': 0.6}  # Yellow
-                )
+                }
+            ]
+
+            # Row insert, every cell write and the yellow background on contract
+            # headers and the balance row in one batchUpdate
+            filled = self.apply_template_fill(
+                spreadsheet_id=spreadsheet_id,
+                sheet_name=sheet,
+                updates=updates,
+                start_row=17,
+                num_rows=num_rows_to_insert,
+                rows_to_format=contract_header_rows + [balance_row_index],
+                background_color={'red': 1.0, 'green': 0.9, 'blue': 0.6}  # Yellow
+            )
 
-            logger.info(f"Multi template filled with {len(contracts_data)} contracts")
+            if filled:
+                logger.info("Multi template filled with %s contracts", len(contracts_data))
+            return filled
             
         except Exception as e:
-            logger.error(f"Error filling multi template: {e}", exc_info=True)
+            logger.error("Error filling multi template: %s", e, exc_info=True)
+            return False
     
     def delete_sheet_tab(self, spreadsheet_id: str, sheet_name: str):
         """
@@ -1089,17 +1396,10 @@ Return ONLY a JSON object with this exact format (no additional text):
             sheet_name: Name of the sheet to delete
         """
         try:
-            # Get sheet info to find the sheet ID
-            sheet_info = self.sheets_client.get_sheet_info(spreadsheet_id)
-            sheet_id = None
-            
-            for sheet in sheet_info.get('sheets', []):
-                if sheet.get('title') == sheet_name:
-                    sheet_id = sheet.get('sheet_id')
-                    break
+            sheet_id = self._resolve_sheet_id(spreadsheet_id, sheet_name)
             
             if not sheet_id:
-                logger.warning(f"Sheet '{sheet_name}' not found, skipping deletion")
+                logger.warning("Sheet '%s' not found, skipping deletion", sheet_name)
                 return
             
             # Use Sheets API batchUpdate to delete the sheet
@@ -1121,21 +1421,59 @@ Return ONLY a JSON object with this exact format (no additional text):
                 body=request_body
             ).execute()
             
-            logger.info(f"Deleted sheet tab: {sheet_name}")
+            with self._sheet_id_lock:
+                self._sheet_id_cache.get(spreadsheet_id, {}).pop(sheet_name, None)
+            
+            logger.info("Deleted sheet tab: %s", sheet_name)
             
         except Exception as e:
-            logger.error(f"Error deleting sheet tab '{sheet_name}': {e}", exc_info=True)
+            logger.error("Error deleting sheet tab '%s': %s", sheet_name, e, exc_info=True)
 
-    def export_sheet_as_pdf(self, spreadsheet_id: str, sheet_name: str) -> Optional[bytes]:
+    def batch_finalize(
+            self,
+            spreadsheet_id: str,
+            keep_sheet: str
+            ) -> Optional[bytes]:
+        """
+        Export the filled sheet as PDF and retire the working copy.
+
+        The export is scoped to keep_sheet's GID, so the other template tab never
+        shows up in the PDF and needn't be deleted from a copy that is trashed
+        anyway. The working copy is trashed once the export finishes (whether or
+        not it succeeded), before returning.
+
+        Args:
+            spreadsheet_id: Working copy spreadsheet ID
+            keep_sheet: Name of the sheet to export
+
+        Returns:
+            PDF bytes or None if the export failed
+        """
+        try:
+            pdf_bytes = self.export_sheet_as_pdf(spreadsheet_id, keep_sheet)
+        finally:
+            # Synchronous on purpose: a frozen Lambda would never run queued cleanup
+            self.cleanup_working_copy(spreadsheet_id)
+
+        return pdf_bytes
+
+    def export_sheet_as_pdf(
+            self,
+            spreadsheet_id: str,
+            sheet_name: str,
+            dest: Optional[BinaryIO] = None
+            ) -> Optional[Union[bytes, BinaryIO]]:
         """
         Export a specific sheet as PDF with gridlines hidden.
 
         Args:
             spreadsheet_id: Spreadsheet ID
             sheet_name: Name of the sheet to export
+            dest: Optional writable binary file; when given, the PDF is streamed
+                into it instead of being returned as bytes
 
         Returns:
-            PDF bytes or None if failed
+            PDF bytes (or dest, when given) or None if failed
         """
         try:
             # Get credentials
@@ -1145,13 +1483,7 @@ Return ONLY a JSON object with this exact format (no additional text):
                 return None
 
             # Get sheet GID
-            sheet_info = self.sheets_client.get_sheet_info(spreadsheet_id)
-            sheet_gid = None
-
-            for sheet in sheet_info.get('sheets', []):
-                if sheet.get('title') == sheet_name:
-                    sheet_gid = sheet.get('sheet_id')
-                    break
+            sheet_gid = self._resolve_sheet_id(spreadsheet_id, sheet_name)
 
             # Build export URL with parameters to hide gridlines
             export_params = {
@@ -1177,18 +1509,23 @@ Return ONLY a JSON object with this exact format (no additional text):
                 'Authorization': f'Bearer {credentials.token}'
             }
 
-            import requests
-            response = requests.get(full_url, headers=headers, timeout=60)
+            with _http.get(full_url, headers=headers, timeout=60, stream=True) as response:
+                if response.status_code != 200:
+                    logger.error("Failed to export PDF: HTTP %s - %s", response.status_code, response.text)
+                    return None
 
-            if response.status_code == 200:
-                logger.info(f"Successfully exported sheet '{sheet_name}' as PDF")
-                return response.content
-            else:
-                logger.error(f"Failed to export PDF: HTTP {response.status_code} - {response.text}")
-                return None
+                # Stream the body into the destination instead of letting requests accumulate it
+                pdf_buffer = dest if dest is not None else BytesIO()
+                size = 0
+                for chunk in response.iter_content(chunk_size=self.PDF_CHUNK_SIZE):
+                    pdf_buffer.write(chunk)
+                    size += len(chunk)
+
+            logger.info("Successfully exported sheet '%s' as PDF (%s bytes)", sheet_name, size)
+            return dest if dest is not None else pdf_buffer.getvalue()
 
         except Exception as e:
-            logger.error(f"Error exporting sheet as PDF: {e}", exc_info=True)
+            logger.error("Error exporting sheet as PDF: %s", e, exc_info=True)
             return None
 
     def cleanup_working_copy(self, spreadsheet_id: str):
@@ -1198,6 +1535,9 @@ Return ONLY a JSON object with this exact format (no additional text):
         Args:
             spreadsheet_id: Spreadsheet ID to delete
         """
+        with self._sheet_id_lock:
+            self._sheet_id_cache.pop(spreadsheet_id, None)
+
         try:
             credentials = self.sheets_client.get_credentials()
             if not credentials:
@@ -1214,147 +1554,191 @@ Return ONLY a JSON object with this exact format (no additional text):
 
             trash_body = {'trashed': True}
 
-            import requests
-            response = requests.patch(url, headers=headers, json=trash_body, params=params, timeout=30)
+            response = _http.patch(url, headers=headers, json=trash_body, params=params, timeout=30)
 
             if response.status_code == 200:
                 logger.info("Successfully moved working copy to trash")
             elif response.status_code == 404:
                 logger.info("Working copy already deleted (404)")
             else:
-                logger.warning(f"Could not move working copy to trash: HTTP {response.status_code} - {response.text}")
+                logger.warning("Could not move working copy to trash: HTTP %s - %s", response.status_code, response.text)
 
         except Exception as e:
-            logger.warning(f"Could not cleanup working copy: {e}")
+            logger.warning("Could not cleanup working copy: %s", e)
 
-    def insert_rows_with_formatting(
-            self,
-            spreadsheet_id: str,
-            sheet_name: str,
-            start_row: int,
-            num_rows: int,
-            source_row: int
-            ):
-        import gspread, requests, os, logging
-        logger = logging.getLogger(__name__)
+    @staticmethod
+    def _insert_rows_requests(sheet_id: int, start_row: int, num_rows: int) -> List[Dict]:
+        """
+        Build the batchUpdate request that inserts rows inheriting the format of the row above.
 
-        try:
-            # --- gspread: connect ---
-            json_path = os.path.join(os.path.dirname(__file__), "smart-rental-478516-a8bff3c083a8.json")
-            gc = gspread.service_account(filename=json_path)
-            sh = gc.open_by_key(spreadsheet_id)
-            ws = sh.worksheet(sheet_name)
+        Args:
+            sheet_id: Numeric sheetId of the sheet
+            start_row: First inserted row (1-based)
+            num_rows: Number of rows to insert
 
-            # --- get sheetId via requests (needed for batchUpdate) ---
-            token = self.sheets_client._get_access_token()
-            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-            sheet_info_url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}?fields=sheets.properties"
-            sheet_data = requests.get(sheet_info_url, headers=headers).json()
+        Returns:
+            List of batchUpdate request dicts
+        """
+        return [
+            {
+                "insertDimension": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "dimension": "ROWS",
+                        "startIndex": start_row - 1,
+                        "endIndex": start_row - 1 + num_rows
+                    },
+                    "inheritFromBefore": True
+                }
+            }
+        ]
 
-            sheet_id = None
-            for s in sheet_data.get("sheets", []):
-                if s["properties"]["title"] == sheet_name:
-                    sheet_id = s["properties"]["sheetId"]
-                    break
+    @staticmethod
+    def _values_request(sheet_id: int, rng: str, values: List[List], cells: Optional[Tuple] = None) -> Dict:
+        """
+        Build an updateCells request that writes values the way a RAW values update would.
 
-            if sheet_id is None:
-                logger.error(f"Sheet '{sheet_name}' not found. Available sheets: {[s['properties']['title'] for s in sheet_data.get('sheets',[])]}")
-                return
+        Args:
+            sheet_id: Numeric sheetId of the sheet
+            rng: A1 range (only its top-left cell is used), e.g. "Single!I10:I14"
+            values: Row-major values to write
+            cells: Optional per-column CellData builders (e.g. _number_cell); when
+                given, values are typed by column instead of by inspection
 
-            # --- insert empty rows ---
-            insert_payload = {
-                "requests": [
-                    {
-                        "insertDimension": {
-                            "range": {
-                                "sheetId": sheet_id,
-                                "dimension": "ROWS",
-                                "startIndex": start_row - 1,
-                                "endIndex": start_row - 1 + num_rows
-                            },
-                            "inheritFromBefore": True
-                        }
-                    }
-                ]
+        Returns:
+            updateCells request dict
+        """
+        row_index, column_index = _a1_start(rng)
+
+        def cell(value):
+            if value is None or value == '':
+                return {}
+            if isinstance(value, bool):
+                return {'userEnteredValue': {'boolValue': value}}
+            if isinstance(value, (int, float)):
+                return {'userEnteredValue': {'numberValue': value}}
+            return {'userEnteredValue': {'stringValue': str(value)}}
+
+        if cells:
+            rows = [{'values': [build(v) for build, v in zip(cells, row)]} for row in values]
+        else:
+            rows = [{'values': [cell(v) for v in row]} for row in values]
+
+        return {
+            'updateCells': {
+                'rows': rows,
+                'fields': 'userEnteredValue',
+                'start': {
+                    'sheetId': sheet_id,
+                    'rowIndex': row_index,
+                    'columnIndex': column_index
+                }
             }
-            batch_url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}:batchUpdate"
-            requests.post(batch_url, headers=headers, json=insert_payload)
+        }
+
+    @staticmethod
+    def _row_formatting_requests(
+            sheet_id: int,
+            rows_to_format: List[int],
+            background_color: Dict[str, float]
+            ) -> List[Dict]:
+        """
+        Build repeatCell requests that set the background color of rows (columns A-G).
 
-            logger.info(f"Inserted {num_rows} rows at {start_row} and copied formula from G{source_row}")
+        Adjacent rows are merged into one request per contiguous run.
 
-        except Exception as e:
-            logger.error(f"Error inserting rows with formatting: {e}", exc_info=True)
+        Args:
+            sheet_id: Numeric sheetId of the sheet
+            rows_to_format: List of row indices (0-indexed) to format
+            background_color: Dict with 'red', 'green', 'blue' values (0-1)
 
-    def apply_row_formatting(
-        self,
-        spreadsheet_id: str,
-        sheet_name: str,
-        rows_to_format: List[int],
-        background_color: Dict[str, float]
-    ):
+        Returns:
+            List of batchUpdate request dicts
         """
-        Apply background color formatting to specific rows.
+        runs = []  # [start, end) row index pairs
+        for row_index in sorted(set(rows_to_format)):
+            if runs and runs[-1][1] == row_index:
+                runs[-1][1] = row_index + 1
+            else:
+                runs.append([row_index, row_index + 1])
+
+        return [
+            {
+                'repeatCell': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'startRowIndex': start,
+                        'endRowIndex': end,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': 7  # Columns A-G
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'backgroundColor': background_color
+                        }
+                    },
+                    'fields': 'userEnteredFormat.backgroundColor'
+                }
+            }
+            for start, end in runs
+        ]
+
+    def apply_template_fill(
+            self,
+            spreadsheet_id: str,
+            sheet_name: str,
+            updates: List[Dict],
+            start_row: int,
+            num_rows: int,
+            rows_to_format: Optional[List[int]] = None,
+            background_color: Optional[Dict[str, float]] = None
+            ) -> bool:
+        """
+        Insert formatted rows, write cell values and apply row highlighting in a
+        single spreadsheets.batchUpdate (one round trip, applied atomically).
+
+        Subrequests run in order, so value ranges must already account for the
+        inserted rows.
 
         Args:
             spreadsheet_id: Spreadsheet ID
             sheet_name: Name of the sheet
-            rows_to_format: List of row indices (0-indexed) to format
-            background_color: Dict with 'red', 'green', 'blue' values (0-1)
+            updates: List of {'range', 'values'} dicts (same shape as batch_update),
+                optionally with 'cells' column builders for _values_request
+            start_row: First inserted row (1-based)
+            num_rows: Number of rows to insert (0 to skip the insert)
+            rows_to_format: Optional row indices (0-indexed) to highlight
+            background_color: Highlight color for rows_to_format
+
+        Returns:
+            True if the batchUpdate succeeded
         """
         try:
-            # Get sheet GID
-            sheet_info = self.sheets_client.get_sheet_info(spreadsheet_id)
-            sheet_gid = None
-
-            for sheet in sheet_info.get('sheets', []):
-                if sheet.get('title') == sheet_name:
-                    sheet_gid = sheet.get('sheet_id')
-                    break
-
-            if sheet_gid is None:
-                logger.error(f"Sheet '{sheet_name}' not found")
-                return
+            token = self.sheets_client._get_access_token()
+            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            sheet_id = self._resolve_sheet_id(spreadsheet_id, sheet_name)
 
-            # Use Sheets API batchUpdate to apply formatting
-            service = self.sheets_client.get_service()
-            if not service:
-                logger.error("Failed to get Sheets service")
-                return
+            if sheet_id is None:
+                logger.error("Sheet '%s' not found", sheet_name)
+                return False
 
-            # Build requests for each row
             requests_list = []
+            if num_rows > 0:
+                requests_list.extend(self._insert_rows_requests(sheet_id, start_row, num_rows))
+            requests_list.extend(self._values_request(sheet_id, upd['range'], upd['values'], upd.get('cells')) for upd in updates)
+            if rows_to_format and background_color:
+                requests_list.extend(self._row_formatting_requests(sheet_id, rows_to_format, background_color))
 
-            for row_index in rows_to_format:
-                requests_list.append({
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': sheet_gid,
-                            'startRowIndex': row_index,
-                            'endRowIndex': row_index + 1,
-                            'startColumnIndex': 0,
-                            'endColumnIndex': 7  # Columns A-G
-                        },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'backgroundColor': background_color
-                            }
-                        },
-                        'fields': 'userEnteredFormat.backgroundColor'
-                    }
-                })
+            batch_url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}:batchUpdate"
+            response = _http.post(batch_url, headers=headers, data=_json_body({"requests": requests_list}), timeout=30)
 
-            request_body = {
-                'requests': requests_list
-            }
+            if response.status_code != 200:
+                logger.error("Template fill failed: %s %s", response.status_code, response.text)
+                return False
 
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=request_body
-            ).execute()
-
-            logger.info(f"Applied background color to {len(rows_to_format)} rows")
+            logger.info("Template fill applied (%s requests, %s rows inserted at %s)", len(requests_list), num_rows, start_row)
+            return True
 
         except Exception as e:
-            logger.error(f"Error applying row formatting: {e}", exc_info=True)
-
-
+            logger.error("Error applying template fill: %s", e, exc_info=True)
+            return False
@@ -9,12 +9,205 @@ Handles:
 - A bit of caching so we don't hammer the API too much
 """
 
-import json, time, requests
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import asyncio, itertools, json, operator, os, re, threading, time, requests
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from datetime import datetime, timezone
 
 from .base_client import BaseClient
 
+try:
+    from googleapiclient.discovery import build
+    from googleapiclient.errors import Error as GoogleApiError
+except ImportError:  # get_service()/get_drive_service() log and return None without it
+    build = GoogleApiError = None
+
+try:
+    import orjson
+except ImportError:  # optional - stdlib json works, just slower on big value arrays
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _col_letters(n: int) -> str:
+    """Convert col number to spreadsheet letters the slow way (1=A, 27=AA, etc)."""
+    parts = []
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        parts.append(chr(rem + ord("A")))
+    return "".join(reversed(parts))
+
+
+# Every column Sheets allows (A..ZZZ), so lookups never have to compute letters
+_MAX_COLS = 18278
+_COL_LETTERS = [""] + [_col_letters(i) for i in range(1, _MAX_COLS + 1)]
+
+# Sheet range: [SheetName!]A1:B10 or [SheetName!]A:B or [SheetName!]1:10
+_SHEET_RANGE_RE = re.compile(r'^(?:[^!]+!)?[A-Z]+\d*:[A-Z]+\d*$|^(?:[^!]+!)?[A-Z]+:[A-Z]+$|^(?:[^!]+!)?\d+:\d+$')
+
+# First row number of an A1 range like "'Sheet 1'!A2:Q2"
+_RANGE_START_ROW_RE = re.compile(r"![A-Z]+(\d+)")
+
+
+def _cell_text(cell: Any) -> str:
+    """Text to validate for a cell: strings as-is, "" for None/numbers (nothing to check), else str()."""
+    if cell.__class__ is str:
+        return cell
+    if cell is None or isinstance(cell, (int, float, bool)):
+        return ""
+    return str(cell)
+
+
+# Cell part of an A1 range: "A1", "A1:B10", "A:A", "1:10", "A2:C" ...
+_A1_CELLS_RE = re.compile(r"^([A-Z]*)(\d*)(?::([A-Z]*)(\d*))?$")
+_SPAN_MAX = 1 << 30  # open-ended row/column bound
+
+
+def _letters_to_col(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+@lru_cache(maxsize=4096)
+def _a1_span(rng: str) -> Optional[Tuple[str, int, int, int, int]]:
+    """(tab lower, first row, last row, first col, last col) covered by "Tab!A1:B2"; None if it can't be told."""
+    if "!" not in rng:
+        return None  # bare "Sheet1" or "A1:B2" - tab unknown, treat as touching everything
+    tab, _, cells = rng.rpartition("!")
+    if len(tab) > 1 and tab[0] == tab[-1] == "'":
+        tab = tab[1:-1].replace("''", "'")
+    m = _A1_CELLS_RE.match(cells.upper())
+    if not m:
+        return None
+    c0, r0, c1, r1 = m.groups()
+    if c1 is None:  # single cell / column / row reference
+        c1, r1 = c0, r0
+    return (
+        tab.lower(),
+        int(r0) if r0 else 1,
+        int(r1) if r1 else _SPAN_MAX,
+        _letters_to_col(c0) if c0 else 1,
+        _letters_to_col(c1) if c1 else _SPAN_MAX,
+    )
+
+
+def _whole_tab(sheet_name: str) -> str:
+    """A1 range covering a whole tab ("Sheet1" / "Sheet1!A1" -> "Sheet1!") - what an append can touch."""
+    return f"{sheet_name.rpartition('!')[0] or sheet_name}!"
+
+
+def _spans_overlap(cached: Optional[Tuple[str, int, int, int, int]],
+                   written: List[Tuple[str, int, int, int, int]]) -> bool:
+    """True if a cached range (None = unknown) may have been changed by any of the written spans."""
+    if cached is None:
+        return True
+    tab, r0, r1, c0, c1 = cached
+    return any(
+        w_tab == tab and w_r0 <= r1 and r0 <= w_r1 and w_c0 <= c1 and c0 <= w_c1
+        for w_tab, w_r0, w_r1, w_c0, w_c1 in written
+    )
+
+
+class _DriveRetry(Retry):
+    """Retry that also replays POST, but only on 429 (the create was never run).
+
+    A 5xx or dropped connection after a folder/file/permission POST may have
+    created it anyway, so those are not retried (POST stays out of allowed_methods).
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method and method.upper() == "POST":
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class BulkUpdateResult:
+    """Outcome of bulk_update_cells: truthy only when every chunk was written.
+
+    Chunks go out concurrently, so a failure can leave earlier/other chunks
+    already written; landed_ranges lists exactly what made it to the sheet.
+    """
+
+    def __init__(self, ok: bool, chunks: Optional[List[List[str]]] = None,
+                 landed: Optional[List[int]] = None):
+        self.ok = ok
+        self.chunks = chunks or []   # A1 ranges per chunk, in dispatch order
+        self.landed = landed or []   # indices into chunks that were written
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @property
+    def landed_ranges(self) -> List[str]:
+        return [rng for i in self.landed for rng in self.chunks[i]]
+
+    @property
+    def failed_ranges(self) -> List[str]:
+        landed = set(self.landed)
+        return [rng for i, chunk in enumerate(self.chunks) if i not in landed for rng in chunk]
+
+    def __repr__(self) -> str:
+        return f"BulkUpdateResult(ok={self.ok}, landed={len(self.landed)}/{len(self.chunks)} chunks)"
+
+
+# Trims sentence punctuation off a query word (inner '-' and '/' are kept, e.g. "wi-fi", "a/c")
+_strip_punct = operator.methodcaller("strip", ".,?!")
+
+
+# Domain word variations used by QnA scoring (built once, not per call)
+_WORD_VARIATIONS: Dict[str, Tuple[str, ...]] = {
+    # Air Conditioning
+    'aircond': ('aircon', 'aircond', 'air-cond', 'air conditioning', 'ac', 'a/c', 'cooling'),
+    'aircon': ('aircond', 'air-cond', 'air conditioning', 'ac', 'a/c', 'cooling'),
+    'ac': ('aircon', 'aircond', 'air conditioning', 'cooling'),
+    
+    # Water & Plumbing
+    'leak': ('leaking', 'leaked', 'leaks', 'drip', 'dripping', 'water problem'),
+    'water': ('h2o', 'water supply', 'water pressure', 'tap', 'faucet'),
+    'plumbing': ('pipe', 'pipes', 'drain', 'drainage', 'sewage', 'toilet'),
+    
+    # Electrical
+    'electricity': ('electric', 'electrical', 'power', 'trip', 'tripped', 'blackout'),
+    'electrical': ('electric', 'electricity', 'power', 'wiring', 'socket', 'plug'),
+    'trip': ('tripped', 'circuit breaker', 'main switch', 'db box', 'fuse'),
+    
+    # Internet & Connectivity
+    'wifi': ('wi-fi', 'wireless', 'internet', 'connection', 'network', 'online'),
+    'internet': ('wifi', 'wi-fi', 'connection', 'network', 'online', 'connectivity'),
+    'connection': ('connect', 'connectivity', 'network', 'signal'),
+    
+    # Access & Security
+    'key': ('keys', 'door key', 'room key', 'spare key', 'access'),
+    'card': ('access card', 'keycard', 'lift card', 'scan card', 'building card'),
+    'lock': ('locked', 'unlock', 'door lock', 'digital lock', 'smart lock'),
+    
+    # Maintenance & Repair
+    'repair': ('fix', 'fixing', 'broken', 'damaged', 'not working', 'malfunction'),
+    'maintenance': ('maintain', 'service', 'upkeep', 'servicing', 'repair'),
+    'broken': ('damaged', 'not working', 'spoilt', 'faulty', 'malfunction'),
+    
+    # Common Issues
+    'noise': ('noisy', 'loud', 'sound', 'disturbance'),
+    'smell': ('odor', 'stink', 'bad smell', 'smelly'),
+    'hot': ('warm', 'heating', 'temperature', 'too hot'),
+    'cold': ('cool', 'cooling', 'chilly', 'not cold')
+}
+
 
 class GoogleSheetsClient(BaseClient):
     """Wrapper around Google Sheets API (with some caching sprinkled in)."""
@@ -29,6 +222,15 @@ class GoogleSheetsClient(BaseClient):
         self.service_account_file = cfg["service_account_file"]
         self.default_sheet_id = cfg.get("default_sheet_id")
         self.cache_ttl = cfg.get("cache_ttl", 60)
+        # Seconds to wait for a TCP/TLS connect, separate from each call's read timeout
+        self.connect_timeout = float(cfg.get("connect_timeout", 5))
+        # read_range render mode. UNFORMATTED_VALUE skips Google's server-side
+        # formatting (faster on big ranges) but numbers/dates come back raw
+        # (e.g. 45123 instead of "15/07/2023"), so it's opt-in.
+        self.value_render_option = cfg.get("value_render_option", "FORMATTED_VALUE")
+        # Opt-in: RAW writes whose values exactly match a fresh cached FORMULA-render read
+        # of the same range are skipped (edits made outside this client can make that stale)
+        self.skip_unchanged_writes = bool(cfg.get("skip_unchanged_writes", False))
         # Drive-related defaults (optional)
         drive_cfg = self.config.get("google_drive", {}) or {}
         # Shared drive / parent folder id where ticket folders should be created
@@ -36,79 +238,278 @@ class GoogleSheetsClient(BaseClient):
         # Retry/backoff settings for Drive uploads
         self.drive_max_retries = int(drive_cfg.get("max_retries", 3))
         self.drive_retry_delay = float(drive_cfg.get("retry_delay", 2.0))
+        # Files bigger than this go through Drive's resumable upload protocol
+        self.drive_resumable_threshold = int(drive_cfg.get("resumable_threshold", 5 * 1024 * 1024))
+        # Resumable uploads go up in chunks of this size (Drive wants multiples of
+        # 256 KiB), so only one chunk is in memory at a time; 0 = single request
+        chunk_size = int(drive_cfg.get("chunk_size", 8 * 1024 * 1024))
+        self.drive_chunk_size = chunk_size - chunk_size % (256 * 1024)
 
         # token/data caches (token: auth token, data: sheet content)
         self._token_cache: Dict[str, Any] = {}
-        self._data_cache: Dict[str, Any] = {}
+        self._token_lock = threading.Lock()
+        self._token_creds = None  # reused across refreshes, built from the key file once
+        self._headers_cache: Optional[Tuple[str, Dict[str, str]]] = None  # (token, headers built for it)
+        # data cache is a bounded LRU so long-running bots don't grow forever;
+        # _cache_index maps sheet id -> its keys for cheap invalidation
+        self.cache_max_entries = int(cfg.get("cache_max_entries", 1024))
+        self._data_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_index: Dict[str, Set[str]] = {}
+        self._cache_lock = threading.Lock()
 
         # Services cache for API clients
         self._credentials = None
-        self._sheets_service = None
-        self._drive_service = None
+        self._creds_lock = threading.Lock()
+
+        # Parse the service account key once up front (not on the first API call);
+        # if it can't be read yet, _service_account_info() retries lazily
+        self._sa_info: Optional[Dict[str, Any]] = None
+        try:
+            self._service_account_info()
+        except Exception as e:
+            self.log_warning(f"Service account key not loaded yet: {e}")
+        # Discovery clients by (api, version), built on first use; one lock per
+        # (api, version) keeps concurrent first callers from building the same
+        # client twice without serializing Sheets and Drive builds
+        self._services: Dict[Tuple[str, str], Any] = {}
+        self._service_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._service_lock = threading.Lock()  # guards _service_locks
+
+        # One keep-alive session for every raw API call, so TCP/TLS setup to
+        # sheets.googleapis.com / www.googleapis.com happens once, not per call.
+        # Only GETs are retried by the adapter - Sheets appends/batchUpdates aren't
+        # idempotent and resumable uploads resume from the committed byte themselves.
+        read_retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=read_retry)
+        self._session.mount("https://", adapter)
+
+        # Drive calls retry 429/5xx at the adapter, waiting as long as Google's
+        # Retry-After header asks; creates (POST) are only replayed on 429.
+        drive_retry = _DriveRetry(
+            total=self.drive_max_retries,
+            backoff_factor=self.drive_retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._drive_session = requests.Session()
+        self._drive_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=drive_retry))
+
+        # Google only gzips API responses when the User-Agent mentions gzip
+        # (requests already sends Accept-Encoding: gzip and decodes transparently)
+        for session in (self._session, self._drive_session):
+            session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "sr-chatbot (gzip)"})
+
+        # Bounded pool for independent API calls (dropdown setup, bulk uploads).
+        # Kept small so bursts stay within Google's per-user write quota.
+        self.max_workers = int(cfg.get("max_workers", 8))
+        # Created on first use, so clients that never fan out don't hold idle threads
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        # Token bucket for parallel bulk writes: up to write_burst go out at once, then
+        # they refill at write_rate_per_min (the per-user write quota); rate <= 0 disables it
+        self.write_rate_per_min = float(cfg.get("write_rate_per_min", 60))
+        self.write_burst = max(1.0, float(cfg.get("write_burst", self.write_rate_per_min or 1)))
+        self._write_throttle_lock = threading.Lock()
+        self._write_tokens = self.write_burst
+        self._write_tokens_at = time.monotonic()
+
+        # tab name -> gid per spreadsheet; tabs rarely change, so cell writes don't
+        # invalidate this - entries expire after gid_cache_ttl or on an unknown name
+        self.gid_cache_ttl = cfg.get("gid_cache_ttl", 300)
+        self._sheet_gid_cache: Dict[str, Dict[str, int]] = {}
+        self._sheet_gid_cache_ts: Dict[str, float] = {}
+
+        # Config sheet maps: sid -> sheet name -> (loaded at, {key lower: value}, {key lower: row})
+        self.config_cache_ttl = cfg.get("config_cache_ttl", 30)
+        self._config_cache: Dict[str, Dict[str, Tuple[float, Dict[str, str], Dict[str, int]]]] = {}
+        self._config_lock = threading.Lock()
+
+        # find_row lookups: sid -> (sheet, col) -> (column data, {value: first row});
+        # keyed by sid first so a write drops that sheet's entries without a scan
+        self._find_row_index: Dict[str, Dict[Tuple[str, int], Tuple[List[List[Any]], Dict[str, int]]]] = {}
+
+        # QnA scoring index per sheet id (see _get_qna_index)
+        self._qna_index_cache: Dict[str, Dict[str, Any]] = {}
+
+        # (sid, sheet name) pairs whose first-append dropdown check is done
+        self._dropdowns_initialized: Set[Tuple[str, str]] = set()
+
+        # Per-thread update_cell buffer while inside batched_updates()
+        self._batch_local = threading.local()
+
+        # Opt-in: refresh the token / API credentials shortly before they expire so calls
+        # never wait on auth. Off by default - a frozen Lambda container can't run it when
+        # it matters, and an idle one would keep fetching tokens; the expiry check in
+        # _get_access_token / get_credentials is the main path either way.
+        self.background_token_refresh = bool(cfg.get("background_token_refresh", False))
+        self._token_stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
 
         self.log_info("GoogleSheetsClient ready to roll")
 
-    def _get_access_token(self) -> Optional[str]:
-        """Fetch OAuth token from service account. Reuses cached one if not expired."""
-        now = time.time()
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Shared worker pool, created on first use."""
+        pool = self._pool
+        if pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gsheets")
+                pool = self._pool
+        return pool
+
+    def _get_access_token(self, force: bool = False) -> Optional[str]:
+        """Fetch OAuth token from service account. Reuses cached one if not expired (unless force)."""
         token = self._token_cache.get("token")
         exp = self._token_cache.get("expires", 0)
 
         # if valid token exists, just use it
-        if token and now < exp - 60:  # buffer just in case
+        if not force and token and time.time() < exp - 60:  # buffer just in case
             return token
 
-        try:
+        with self._token_lock:
+            # another thread may have refreshed while we waited for the lock
+            token = self._token_cache.get("token")
+            exp = self._token_cache.get("expires", 0)
+            if not force and token and time.time() < exp - 60:
+                return token
+
+            try:
+                from google.auth.transport.requests import Request as GoogleAuthRequest
+
+                if self._token_creds is None:
+                    from google.oauth2.service_account import Credentials
+
+                    self._token_creds = Credentials.from_service_account_info(
+                        self._service_account_info(),
+                        scopes=[
+                            "https://www.googleapis.com/auth/spreadsheets",
+                            "https://www.googleapis.com/auth/drive",
+                        ],
+                    )
+
+                now = time.time()
+                self._token_creds.refresh(GoogleAuthRequest())
+
+                # usually valid ~1h, we'll keep a shorter expiry to be safe
+                self._token_cache = {
+                    "token": self._token_creds.token,
+                    "expires": now + 3300,  # 55 min
+                }
+                self._start_token_refresher()
+                return self._token_creds.token
+
+            except Exception as e:
+                self.log_error("Couldn't get Google Sheets access token", e)
+                return None
+
+    def _service_account_info(self) -> Dict[str, Any]:
+        """Service account key as a dict, parsed once and reused."""
+        if self._sa_info is None:
             # NOTE: The file can either be JSON string content or a filepath
             if self.service_account_file.strip().startswith("{"):
-                creds_data = json.loads(self.service_account_file)
+                self._sa_info = json.loads(self.service_account_file)
             else:
                 with open(self.service_account_file, "r", encoding="utf-8") as fh:
-                    creds_data = json.load(fh)
-
-            from google.oauth2.service_account import Credentials
-            from google.auth.transport.requests import Request as GoogleAuthRequest
-
-            creds = Credentials.from_service_account_info(
-                creds_data,
-                scopes=[
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive",
-                ],
-            )
-            creds.refresh(GoogleAuthRequest())
-
-            # usually valid ~1h, we'll keep a shorter expiry to be safe
-            self._token_cache = {
-                "token": creds.token,
-                "expires": now + 3300,  # 55 min
-            }
-            return creds.token
+                    self._sa_info = json.load(fh)
+        return self._sa_info
+
+    def _credentials_expire_at(self) -> float:
+        """Epoch seconds when the API-client credentials expire (0 if none fetched yet)."""
+        expiry = getattr(self._credentials, "expiry", None)
+        if expiry is None:
+            return 0
+        return expiry.replace(tzinfo=timezone.utc).timestamp()  # google-auth keeps naive UTC
+
+    def _start_token_refresher(self) -> None:
+        """Start the background refresh thread on first token fetch (if enabled and not closed)."""
+        if not self.background_token_refresh or self._refresh_thread is not None or self._token_stop.is_set():
+            return
+        self._refresh_thread = threading.Thread(
+            target=self._token_refresher, name="gsheets-token", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _token_refresher(self) -> None:
+        """Background loop: refresh the cached token and API credentials ~5 min before they expire."""
+        while True:
+            deadlines = [
+                exp - 300
+                for exp in (self._token_cache.get("expires", 0), self._credentials_expire_at())
+                if exp
+            ]
+            # nothing fetched yet - auth stays lazy until first API call
+            wait = max(min(deadlines) - time.time(), 0) if deadlines else 60
+            if self._token_stop.wait(wait):
+                return
+
+            ok = True
+            exp = self._token_cache.get("expires", 0)
+            if exp and exp - 300 <= time.time():
+                ok = bool(self._get_access_token(force=True))
+            creds_exp = self._credentials_expire_at()
+            if creds_exp and creds_exp - 300 <= time.time():
+                ok = self._refresh_credentials() and ok
+            if not ok:
+                # refresh failed (already logged) - back off before trying again
+                if self._token_stop.wait(60):
+                    return
+
+    def _refresh_credentials(self) -> bool:
+        """Refresh the API-client credentials in place (serialized with get_credentials)."""
+        try:
+            import google.auth.transport.requests as auth_requests
 
+            with self._creds_lock:
+                if self._credentials is None:
+                    return True
+                self._credentials.refresh(auth_requests.Request())
+            return True
         except Exception as e:
-            self.log_error("Couldn't get Google Sheets access token", e)
-            return None
+            self.log_error("Background credentials refresh failed", e)
+            return False
 
     def _get_headers(self) -> Optional[Dict[str, str]]:
+        """Auth headers for the current token, built once per token (shared dict - copy before changing it)."""
         token = self._get_access_token()
         if not token:
             return None
-        return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        cached = self._headers_cache
+        if cached is None or cached[0] is not token:
+            cached = (token, {"Authorization": f"Bearer {token}", "Content-Type": "application/json"})
+            self._headers_cache = cached
+        return cached[1]
 
     def read_range(
-        self, rng: str, sheet_id: Optional[str] = None, use_cache: bool = True
+        self, rng: str, sheet_id: Optional[str] = None, use_cache: bool = True,
+        value_render_option: Optional[str] = None,
     ) -> List[List[Any]]:
-        """Grab some cells from a given range (e.g. 'Sheet1!A1:C10')."""
+        """Grab some cells from a given range (e.g. 'Sheet1!A1:C10').
+
+        value_render_option overrides the configured render mode for this call
+        ("FORMATTED_VALUE", "UNFORMATTED_VALUE" or "FORMULA").
+        """
         sid = sheet_id or self.default_sheet_id
         if not sid:
             self.log_error("read_range: no sheet id configured")
             return []
 
-        cache_key = f"{sid}_{rng}"
-        if use_cache and cache_key in self._data_cache:
-            cached = self._data_cache[cache_key]
-            if time.time() < cached["expires"]:
-                return cached["data"]
+        render = value_render_option or self.value_render_option
+        cache_key = f"{sid}_{rng}" if render == "FORMATTED_VALUE" else f"{sid}_{rng}_{render}"
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
             headers = self._get_headers()
@@ -116,17 +517,15 @@ class GoogleSheetsClient(BaseClient):
                 return []
 
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}/values/{rng}"
-            resp = requests.get(url, headers=headers, timeout=30)
+            params = {"majorDimension": "ROWS", "valueRenderOption": render}
+            resp = self._session.get(url, headers=headers, params=params, timeout=(self.connect_timeout, 30))
 
             if resp.status_code == 200:
-                body = resp.json()
+                body = _json_loads(resp.content)
                 values = body.get("values", [])
 
                 if use_cache:
-                    self._data_cache[cache_key] = {
-                        "data": values,
-                        "expires": time.time() + self.cache_ttl,
-                    }
+                    self._cache_put(sid, cache_key, values, rng)
 
                 self.log_info(f"Read {len(values)} rows from {rng}")
                 return values
@@ -137,6 +536,80 @@ class GoogleSheetsClient(BaseClient):
             self.log_error(f"Exception while reading range {rng}", e)
             return []
 
+    def batch_read_ranges(
+        self, ranges: List[str], sheet_id: Optional[str] = None, use_cache: bool = True
+    ) -> Dict[str, List[List[Any]]]:
+        """Grab several ranges from one spreadsheet in a single values:batchGet call.
+
+        Returns a dict mapping each requested range string to its rows.
+        Ranges that couldn't be read are left out of the result.
+        """
+        sid = sheet_id or self.default_sheet_id
+        if not sid:
+            self.log_error("batch_read_ranges: no sheet id configured")
+            return {}
+
+        result: Dict[str, List[List[Any]]] = {}
+        to_fetch = []
+        for rng in ranges:
+            cached = self._cache_get(f"{sid}_{rng}") if use_cache else None
+            if cached is not None:
+                result[rng] = cached
+            else:
+                to_fetch.append(rng)
+
+        if not to_fetch:
+            return result
+
+        try:
+            headers = self._get_headers()
+            if not headers:
+                return result
+
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}/values:batchGet"
+            resp = self._session.get(url, headers=headers, params={"ranges": to_fetch}, timeout=(self.connect_timeout, 30))
+
+            if resp.status_code == 200:
+                # valueRanges come back in request order (with normalized A1 names)
+                value_ranges = _json_loads(resp.content).get("valueRanges", [])
+                for rng, value_range in zip(to_fetch, value_ranges):
+                    values = value_range.get("values", [])
+                    result[rng] = values
+
+                    if use_cache:
+                        self._cache_put(sid, f"{sid}_{rng}", values, rng)
+
+                self.log_info(f"Batch read {len(value_ranges)} ranges from {sid}")
+            else:
+                self.log_error(f"batch_read_ranges failed ({resp.status_code}): {resp.text}")
+        except Exception as e:
+            self.log_error(f"Exception while batch reading ranges {to_fetch}", e)
+
+        return result
+
+    # --- async facade (for callers running on an event loop) ---
+    # Reads run on the client's bounded pool over the shared keep-alive session,
+    # so e.g. QnA / settings lookups can be awaited together with asyncio.gather.
+
+    async def read_range_async(
+        self, rng: str, sheet_id: Optional[str] = None, use_cache: bool = True,
+        value_render_option: Optional[str] = None,
+    ) -> List[List[Any]]:
+        """Awaitable read_range (same args/result), doesn't block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.read_range, rng, sheet_id, use_cache, value_render_option
+        )
+
+    async def batch_read_ranges_async(
+        self, ranges: List[str], sheet_id: Optional[str] = None, use_cache: bool = True
+    ) -> Dict[str, List[List[Any]]]:
+        """Awaitable batch_read_ranges (same args/result), doesn't block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.batch_read_ranges, ranges, sheet_id, use_cache
+        )
+
     def write_range(
         self,
         rng: str,
@@ -144,12 +617,19 @@ class GoogleSheetsClient(BaseClient):
         sheet_id: Optional[str] = None,
         value_input_option: str = "RAW",
     ) -> bool:
-        """Overwrite a range with data (RAW or USER_ENTERED)."""
+        """Overwrite a range with data (RAW or USER_ENTERED); queued instead inside batched_updates."""
+        if self._queue_batched(rng, rows, sheet_id, value_input_option):
+            return True
+
         sid = sheet_id or self.default_sheet_id
         if not sid:
             self.log_error("write_range: no sheet id configured")
             return False
 
+        if self._matches_cached(sid, rng, rows, value_input_option):
+            self.log_info(f"write_range no-op, {rng} already holds these values")
+            return True
+
         try:
             headers = self._get_headers()
             if not headers:
@@ -159,10 +639,11 @@ class GoogleSheetsClient(BaseClient):
             payload = {"values": rows, "majorDimension": "ROWS"}
             params = {"valueInputOption": value_input_option}
 
-            resp = requests.put(url, headers=headers, json=payload, params=params)
+            resp = self._session.put(url, headers=headers, data=_json_dumps(payload), params=params,
+                                     timeout=(self.connect_timeout, 30))
 
             if resp.status_code == 200:
-                self._invalidate_cache(sid)
+                self._invalidate_ranges(sid, [rng])
                 self.log_info(f"Wrote {len(rows)} row(s) to {rng}")
                 return True
             else:
@@ -195,73 +676,170 @@ class GoogleSheetsClient(BaseClient):
         Returns:
             bool: Success status
         """
+        return self._append_row(sheet_name, row, sheet_id, value_input_option, setup_dropdowns) is not None
+
+    def _append_row(
+        self,
+        sheet_name: str,
+        row: List[Any],
+        sheet_id: Optional[str] = None,
+        value_input_option: str = "RAW",
+        setup_dropdowns: Optional[dict] = None,
+    ) -> Optional[int]:
+        """append_row that returns the 1-based row the data landed on (0 if the response didn't say, None on failure)."""
         sid = sheet_id or self.default_sheet_id
         if not sid:
             self.log_error("append_row: no sheet id configured")
-            return False
+            return None
 
         try:
             headers = self._get_headers()
             if not headers:
-                return False
-
-            # Check if this is the first data row (only header exists)
-            if setup_dropdowns:
-                existing_data = self.read_range(f"{sheet_name}!A:A", sid, use_cache=False)
-                if len(existing_data) <= 1:  # Only header row exists
-                    self.log_info(f"First data row detected, setting up dropdowns for {sheet_name}")
-                    for col, options in setup_dropdowns.items():
-                        self.add_data_validation_dropdown(
-                            sheet_name=sheet_name,
-                            col=col,
-                            start_row=2,
-                            end_row=1000,
-                            values=options,
-                            sheet_id=sid
-                        )
+                return None
 
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}/values/{sheet_name}:append"
             payload = {"values": [row], "majorDimension": "ROWS"}
             params = {"valueInputOption": value_input_option, "insertDataOption": "INSERT_ROWS"}
 
-            resp = requests.post(url, headers=headers, json=payload, params=params)
+            resp = self._session.post(url, headers=headers, data=_json_dumps(payload), params=params,
+                                      timeout=(self.connect_timeout, 30))
 
             if resp.status_code == 200:
-                self._invalidate_cache(sid)
+                self._invalidate_ranges(sid, [_whole_tab(sheet_name)])
                 self.log_info(f"Appended row to {sheet_name}")
-                return True
+
+                # The append response says where the row landed (e.g. "Sheet1!A47:D47")
+                updated_range = _json_loads(resp.content).get("updates", {}).get("updatedRange", "")
+                m = _RANGE_START_ROW_RE.search(updated_range)
+                new_row = int(m.group(1)) if m else 0
+
+                # First data row? No column read is needed, and each sheet is only checked once.
+                if setup_dropdowns and (sid, sheet_name) not in self._dropdowns_initialized:
+                    self._setup_first_row_dropdowns(sid, sheet_name, setup_dropdowns, new_row)
+                return new_row
             else:
                 self.log_error(f"append_row failed: {resp.status_code} {resp.text}")
-                return False
+                return None
         except Exception as e:
             self.log_error(f"append_row exploded for {sheet_name}", e)
-            return False
+            return None
+
+    def _setup_first_row_dropdowns(self, sid: str, sheet_name: str, setup_dropdowns: dict, new_row: int) -> None:
+        """Add column dropdowns after the first data row lands; failures are logged, never raised (the row is already written)."""
+        add_dropdown = getattr(self, "add_data_validation_dropdown", None)
+        if add_dropdown is None:
+            self.log_warning(f"Dropdown setup for {sheet_name} skipped: add_data_validation_dropdown is not available")
+            self._dropdowns_initialized.add((sid, sheet_name))
+            return
+
+        try:
+            if new_row == 2:  # Only header row existed
+                self.log_info(f"First data row detected, setting up dropdowns for {sheet_name}")
+                # one validation request per column, all independent - run them concurrently
+                list(self._executor.map(
+                    lambda item: add_dropdown(
+                        sheet_name=sheet_name,
+                        col=item[0],
+                        start_row=2,
+                        end_row=1000,
+                        values=item[1],
+                        sheet_id=sid
+                    ),
+                    setup_dropdowns.items()
+                ))
+            self._dropdowns_initialized.add((sid, sheet_name))
+        except Exception as e:
+            self.log_warning(f"Dropdown setup failed for {sheet_name} (row was appended): {e}")
 
     def find_row(
         self, sheet_name: str, col_idx: int, target: str, sheet_id: Optional[str] = None
     ) -> Optional[int]:
         """Find row number in sheet where given column matches value (1-based index)."""
-        data = self.read_range(f"{sheet_name}!A:ZZ", sheet_id)
-        for i, row in enumerate(data, start=1):
-            if len(row) >= col_idx:
-                if str(row[col_idx - 1]).strip() == str(target).strip():
-                    return i
-        return None  # not found
+        # only the column being searched is fetched (not A:ZZ); rows stay aligned from row 1
+        sid = sheet_id or self.default_sheet_id
+        col_letter = self._colnum_to_letter(col_idx)
+        data = self.read_range(f"{sheet_name}!{col_letter}:{col_letter}", sid)
+
+        # value -> row index, rebuilt only when read_range hands back fresh data
+        key = (sheet_name, col_idx)
+        sheet_index = self._find_row_index.setdefault(sid, {})
+        entry = sheet_index.get(key)
+        if entry is None or entry[0] is not data:
+            index: Dict[str, int] = {}
+            for i, row in enumerate(data, start=1):
+                if row:
+                    index.setdefault(str(row[0]).strip(), i)  # first match wins
+            entry = (data, index)
+            sheet_index[key] = entry
+
+        return entry[1].get(str(target).strip())  # None if not found
 
     def update_cell(
         self, sheet_name: str, row: int, col: int, val: Any, sheet_id: Optional[str] = None
     ) -> bool:
-        """Update a single cell (uses write_range under the hood)."""
+        """Update a single cell (uses write_range under the hood, so it queues inside batched_updates)."""
         col_letter = self._colnum_to_letter(col)
         rng = f"{sheet_name}!{col_letter}{row}"
         return self.write_range(rng, [[val]], sheet_id)
 
+    def _queue_batched(self, rng: str, rows: List[List[Any]], sheet_id: Optional[str], value_input_option: str) -> bool:
+        """Queue a write on this thread's batched_updates buffer; False if no batch is open."""
+        batch = getattr(self._batch_local, "batch", None)
+        if batch is None:
+            return False
+
+        sid = sheet_id or batch["sheet_id"] or self.default_sheet_id
+        batch["pending"].setdefault((sid, value_input_option), []).append({"range": rng, "values": rows})
+        batch["count"] += 1
+        if batch["count"] >= batch["flush_every"]:
+            self._flush_batched_updates(batch)
+        return True
+
+    @contextmanager
+    def batched_updates(self, sheet_id: Optional[str] = None, flush_every: int = 500) -> Iterator[None]:
+        """Buffer update_cell / write_range calls and send them as values:batchUpdate requests.
+
+        Usage:
+            with sheets.batched_updates():
+                for r, v in rows:
+                    sheets.update_cell(name, r, c, v)
+
+        Updates are flushed on exit and every `flush_every` queued writes
+        (one request per spreadsheet and value input option). Buffering is per thread.
+        """
+        outer = getattr(self._batch_local, "batch", None)
+        if outer is not None:
+            # already batching on this thread - just join the outer batch
+            yield
+            return
+
+        batch = {"sheet_id": sheet_id, "flush_every": flush_every, "pending": {}, "count": 0}
+        self._batch_local.batch = batch
+        try:
+            yield
+        finally:
+            self._batch_local.batch = None
+            self._flush_batched_updates(batch)
+
+    def _flush_batched_updates(self, batch: Dict[str, Any]) -> None:
+        """Send everything queued by batched_updates (one batch_update per spreadsheet/input option)."""
+        pending, batch["pending"], batch["count"] = batch["pending"], {}, 0
+        for (sid, value_input_option), updates in pending.items():
+            if updates:
+                self.batch_update(updates, sid, value_input_option)
+
     def batch_update(self, updates: List[Dict[str, Any]], sheet_id: Optional[str] = None, value_input_option: str = "RAW") -> bool:
         """Push multiple updates at once (saves API calls)."""
         sid = sheet_id or self.default_sheet_id
         if not sid or not updates:
             return False
 
+        changed = [upd for upd in updates if not self._matches_cached(sid, upd["range"], upd["values"], value_input_option)]
+        if not changed:
+            self.log_info(f"Batch update no-op, all {len(updates)} ranges already hold these values")
+            return True
+        updates = changed
+
         try:
             headers = self._get_headers()
             if not headers:
@@ -276,10 +854,10 @@ class GoogleSheetsClient(BaseClient):
                 ],
             }
 
-            resp = requests.post(url, headers=headers, json=payload, timeout=30)
+            resp = self._session.post(url, headers=headers, data=_json_dumps(payload), timeout=(self.connect_timeout, 30))
 
             if resp.status_code == 200:
-                self._invalidate_cache(sid)
+                self._invalidate_ranges(sid, [upd["range"] for upd in updates])
                 self.log_info(f"Batch update ok ({len(updates)} updates)")
                 return True
             else:
@@ -301,10 +879,14 @@ class GoogleSheetsClient(BaseClient):
                 return {}
 
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}"
-            resp = requests.get(url, headers=headers, timeout=30)
+            # only ask for what we actually read below
+            params = {
+                "fields": "properties.title,sheets.properties(sheetId,title,sheetType,gridProperties(rowCount,columnCount))"
+            }
+            resp = self._session.get(url, headers=headers, params=params, timeout=(self.connect_timeout, 30))
 
             if resp.status_code == 200:
-                js = resp.json()
+                js = _json_loads(resp.content)
                 sheet_info = []
                 for s in js.get("sheets", []):
                     props = s.get("properties", {})
@@ -325,25 +907,179 @@ class GoogleSheetsClient(BaseClient):
             self.log_error("get_sheet_info error", e)
             return {}
 
+    def list_sheet_titles(self, sheet_id: Optional[str] = None) -> List[str]:
+        """Get just the tab names of a spreadsheet (tiny metadata request)."""
+        sid = sheet_id or self.default_sheet_id
+        if not sid:
+            return []
+
+        try:
+            headers = self._get_headers()
+            if not headers:
+                return []
+
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}"
+            params = {"fields": "sheets.properties.title"}
+            resp = self._session.get(url, headers=headers, params=params, timeout=(self.connect_timeout, 30))
+
+            if resp.status_code == 200:
+                return [
+                    s.get("properties", {}).get("title", "")
+                    for s in _json_loads(resp.content).get("sheets", [])
+                ]
+            else:
+                self.log_error(f"list_sheet_titles failed: {resp.status_code}")
+                return []
+        except Exception as e:
+            self.log_error("list_sheet_titles error", e)
+            return []
+
+    def get_sheet_gids(self, sheet_id: Optional[str] = None) -> Dict[str, int]:
+        """Get {tab name: sheetId} so tabs can be resolved by dict lookup (tiny metadata request)."""
+        sid = sheet_id or self.default_sheet_id
+        if not sid:
+            return {}
+
+        try:
+            headers = self._get_headers()
+            if not headers:
+                return {}
+
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}"
+            params = {"fields": "sheets.properties(title,sheetId)"}
+            resp = self._session.get(url, headers=headers, params=params, timeout=(self.connect_timeout, 30))
+
+            if resp.status_code == 200:
+                return {
+                    s.get("properties", {}).get("title", ""): s.get("properties", {}).get("sheetId")
+                    for s in _json_loads(resp.content).get("sheets", [])
+                }
+            else:
+                self.log_error(f"get_sheet_gids failed: {resp.status_code}")
+                return {}
+        except Exception as e:
+            self.log_error("get_sheet_gids error", e)
+            return {}
+
+    def _get_gid(self, sid: str, sheet_name: str) -> Optional[int]:
+        """Tab gid for sheet_name, from the per-spreadsheet cache when fresh (refetches once for unknown names)."""
+        gids = self._cached_sheet_gids(sid)
+        if sheet_name in gids:
+            return gids[sheet_name]
+        return self._cached_sheet_gids(sid, refresh=True).get(sheet_name)
+
+    def _cached_sheet_gids(self, sid: str, refresh: bool = False) -> Dict[str, int]:
+        """{tab name: gid} for sid (in tab order), refetched when older than gid_cache_ttl or on refresh."""
+        gids = self._sheet_gid_cache.get(sid)
+        if not refresh and gids is not None and time.time() - self._sheet_gid_cache_ts.get(sid, 0) < self.gid_cache_ttl:
+            return gids
+
+        gids = self.get_sheet_gids(sid)
+        if gids:
+            self._sheet_gid_cache[sid] = gids
+            self._sheet_gid_cache_ts[sid] = time.time()
+        return gids
+
     def _colnum_to_letter(self, n: int) -> str:
         """Convert col number to spreadsheet letters (1=A, 27=AA, etc)."""
-        result = ""
-        while n > 0:
-            n, rem = divmod(n - 1, 26)
-            result = chr(rem + ord("A")) + result
-        return result
+        if 0 < n <= _MAX_COLS:
+            return _COL_LETTERS[n]
+        return _col_letters(n)
+
+    def _matches_cached(self, sid: str, rng: str, rows: List[List[Any]], value_input_option: str) -> bool:
+        """True if a RAW write of rows to rng would change nothing per the (unexpired) cached read."""
+        if not self.skip_unchanged_writes or value_input_option != "RAW":
+            return False  # USER_ENTERED parses input, so cached values can't be compared
+        # Only FORMULA reads are comparable: formatted/unformatted reads show a formula's
+        # result (or a number's display text) where a RAW write would store a literal
+        cached = self._cache_get(f"{sid}_{rng}_FORMULA")
+        return cached is not None and cached == rows
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return cached data for key if present and not expired (marks it recently used)."""
+        with self._cache_lock:
+            cached = self._data_cache.get(key)
+            if cached is None:
+                return None
+            if time.time() >= cached["expires"]:
+                self._drop_cache_key(key)
+                return None
+            self._data_cache.move_to_end(key)
+            return cached["data"]
+
+    def _cache_put(self, sid: str, key: str, data: Any, rng: Optional[str] = None) -> None:
+        """Store data under key (rng is the A1 range it came from), evicting LRU entries past cache_max_entries."""
+        with self._cache_lock:
+            self._data_cache[key] = {
+                "data": data,
+                "expires": time.time() + self.cache_ttl,
+                "sid": sid,
+                "span": _a1_span(rng) if rng else None,
+            }
+            self._data_cache.move_to_end(key)
+            self._cache_index.setdefault(sid, set()).add(key)
+            while len(self._data_cache) > self.cache_max_entries:
+                oldest = next(iter(self._data_cache))
+                self._drop_cache_key(oldest)
+
+    def _drop_cache_key(self, key: str) -> None:
+        """Remove one entry from the data cache and the sid index (caller holds _cache_lock)."""
+        cached = self._data_cache.pop(key, None)
+        if cached is None:
+            return
+        keys = self._cache_index.get(cached["sid"])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._cache_index[cached["sid"]]
 
     def _invalidate_cache(self, sid: str) -> None:
         """Clear cached values for a given sheet id only."""
-        bad_keys = [k for k in self._data_cache.keys() if k.startswith(sid)]
-        for k in bad_keys:
-            del self._data_cache[k]
+        with self._cache_lock:
+            for k in self._cache_index.pop(sid, ()):
+                self._data_cache.pop(k, None)
+        self._find_row_index.pop(sid, None)
+        with self._config_lock:
+            self._config_cache.pop(sid, None)
+
+    def _invalidate_ranges(self, sid: str, ranges: List[str]) -> None:
+        """Drop only cached reads of sid that overlap the written A1 ranges (whole sheet id if a range is unclear)."""
+        written = [_a1_span(rng) for rng in ranges]
+        if not written or None in written:
+            self._invalidate_cache(sid)
+            return
+        with self._cache_lock:
+            for k in list(self._cache_index.get(sid, ())):
+                if _spans_overlap(self._data_cache[k]["span"], written):
+                    self._drop_cache_key(k)
+        # find_row / QnA indexes are tied to the cached data objects, so they
+        # rebuild on their own; only the touched Config maps need dropping
+        touched_tabs = {w[0] for w in written}
+        with self._config_lock:
+            config_maps = self._config_cache.get(sid)
+            for name in list(config_maps or ()):
+                if name.lower() in touched_tabs:
+                    config_maps.pop(name, None)
 
     def clear_cache(self) -> None:
         """Nuke all caches (token remains)."""
-        self._data_cache.clear()
+        with self._cache_lock:
+            self._data_cache.clear()
+            self._cache_index.clear()
+        self._sheet_gid_cache.clear()
+        self._sheet_gid_cache_ts.clear()
         self.log_info("Cache wiped")
 
+    def close(self) -> None:
+        """Close pooled HTTP connections and worker threads (client can't make API calls afterwards)."""
+        self._token_stop.set()
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        self._session.close()
+        self._drive_session.close()
+
     # === Google Drive Integration ===
     
     def create_drive_folder(self, folder_name: str, parent_folder_id: Optional[str] = None) -> Optional[str]:
@@ -359,7 +1095,7 @@ class GoogleSheetsClient(BaseClient):
                 'mimeType': 'application/vnd.google-apps.folder'
             }
 
-            params = {}
+            params = {'fields': 'id'}
             # If caller didn't provide a parent, try configured shared drive parent
             effective_parent = parent_folder_id or self.shared_drive_parent_id
             if effective_parent:
@@ -367,10 +1103,10 @@ class GoogleSheetsClient(BaseClient):
                 # When creating under a shared drive, include supportsAllDrives
                 params['supportsAllDrives'] = 'true'
 
-            resp = requests.post(url, headers=headers, json=folder_metadata, params=params or None, timeout=30)
+            resp = self._drive_session.post(url, headers=headers, data=_json_dumps(folder_metadata), params=params, timeout=(self.connect_timeout, 30))
             
             if resp.status_code == 200:
-                folder_data = resp.json()
+                folder_data = _json_loads(resp.content)
                 folder_id = folder_data.get('id')
                 self.log_info(f"Created folder '{folder_name}' with ID: {folder_id}")
                 return folder_id
@@ -382,12 +1118,10 @@ class GoogleSheetsClient(BaseClient):
             self.log_error(f"Exception creating folder {folder_name}", e)
             return None
     
-    def upload_file_to_drive(self, file_data: bytes, filename: str, 
+    def upload_file_to_drive(self, file_data: Union[bytes, BinaryIO], filename: str, 
                            folder_id: Optional[str] = None, 
                            mime_type: str = "application/octet-stream") -> Optional[str]:
-        """Upload a file to Google Drive and return its ID."""
-        # We'll implement retries with exponential backoff
-        import time as _time
+        """Upload a file (bytes or a readable file-like object) to Google Drive and return its ID."""
         try:
             headers = self._get_headers()
             if not headers:
@@ -399,52 +1133,164 @@ class GoogleSheetsClient(BaseClient):
             if effective_folder:
                 metadata['parents'] = [effective_folder]
 
+            # Big files: stream through a resumable session (no multipart copy,
+            # and retries continue from the last committed byte)
+            size = self._upload_size(file_data)
+            if size is not None and size > self.drive_resumable_threshold:
+                return self._upload_resumable(file_data, size, filename, metadata, mime_type, headers, bool(effective_folder))
+
             # Simpler approach - use requests multipart
             files = {
-                'metadata': (None, json.dumps(metadata), 'application/json'),
+                'metadata': (None, _json_dumps(metadata), 'application/json'),
                 'file': (filename, file_data, mime_type)
             }
 
             # Remove Content-Type from headers to let requests set it for multipart
             upload_headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
 
-            params = {'uploadType': 'multipart'}
+            params = {'uploadType': 'multipart', 'fields': 'id'}
             # Include supportsAllDrives when uploading into a folder (shared drive)
             if effective_folder:
                 params['supportsAllDrives'] = 'true'
 
             url = "https://www.googleapis.com/upload/drive/v3/files"
 
+            if hasattr(file_data, "seek"):
+                file_data.seek(0)
+            # requests builds the multipart body up front, so adapter retries
+            # (429/5xx, honoring Retry-After) can resend it as-is
+            resp = self._drive_session.post(url, headers=upload_headers, files=files, params=params, timeout=(self.connect_timeout, 60))
+            if resp.status_code == 200:
+                file_id = _json_loads(resp.content).get('id')
+                self.log_info(f"Uploaded file '{filename}' with ID: {file_id}")
+                return file_id
+
+            self.log_error(f"Failed to upload file {filename} (status {resp.status_code}): {resp.text}")
+            return None
+        except Exception as e:
+            self.log_error(f"Exception uploading file {filename}", e)
+            return None
+    
+    @staticmethod
+    def _upload_size(file_data: Union[bytes, BinaryIO]) -> Optional[int]:
+        """Byte size of an upload body (None if a stream can't tell)."""
+        if isinstance(file_data, (bytes, bytearray)):
+            return len(file_data)
+        try:
+            file_data.seek(0, 2)
+            size = file_data.tell()
+            file_data.seek(0)
+            return size
+        except Exception:
+            return None
+
+    def _upload_resumable(self, file_data: Union[bytes, BinaryIO], size: int, filename: str,
+                          metadata: Dict[str, Any], mime_type: str, headers: Dict[str, str],
+                          shared_drive: bool) -> Optional[str]:
+        """Upload via Drive's resumable protocol, resuming from the last committed byte on retry."""
+        params = {'uploadType': 'resumable', 'fields': 'id'}
+        if shared_drive:
+            params['supportsAllDrives'] = 'true'
+
+        try:
+            # Step 1: open an upload session (metadata only)
+            session_headers = dict(headers)
+            session_headers['X-Upload-Content-Type'] = mime_type
+            session_headers['X-Upload-Content-Length'] = str(size)
+            resp = self._session.post("https://www.googleapis.com/upload/drive/v3/files",
+                                      headers=session_headers, data=_json_dumps(metadata), params=params, timeout=(self.connect_timeout, 30))
+            if resp.status_code != 200 or not resp.headers.get('Location'):
+                self.log_error(f"Failed to start resumable upload (status {resp.status_code}): {resp.text}")
+                return None
+            session_url = resp.headers['Location']
+            auth_headers = {'Authorization': headers['Authorization']}
+
+            # Step 2: send the bytes chunk by chunk, picking up where the server
+            # left off after a failure (retries count per chunk)
+            chunk = self.drive_chunk_size or size
+            offset = 0
             attempt = 0
             while attempt <= self.drive_max_retries:
                 attempt += 1
                 try:
-                    resp = requests.post(url, headers=upload_headers, files=files, params=params, timeout=60)
-                    if resp.status_code == 200:
-                        file_data_resp = resp.json()
-                        file_id = file_data_resp.get('id')
-                        self.log_info(f"Uploaded file '{filename}' with ID: {file_id} (attempt {attempt})")
-                        return file_id
+                    end = min(offset + chunk, size) - 1
+                    if isinstance(file_data, (bytes, bytearray)):
+                        body = memoryview(file_data)[offset:end + 1]
                     else:
-                        # For 4xx errors, don't retry except for 429
-                        if 400 <= resp.status_code < 500 and resp.status_code != 429:
-                            self.log_error(f"Failed to upload file (status {resp.status_code}): {resp.text}")
-                            return None
-                        self.log_warning(f"Transient upload error (status {resp.status_code}) - attempt {attempt}/{self.drive_max_retries}")
+                        file_data.seek(offset)
+                        # the final piece streams straight from the file object
+                        body = file_data if end == size - 1 else file_data.read(end + 1 - offset)
+                    put_headers = dict(auth_headers)
+                    put_headers['Content-Range'] = f"bytes {offset}-{end}/{size}"
+                    resp = self._session.put(session_url, headers=put_headers, data=body, timeout=(self.connect_timeout, 300))
+                    body = None  # drop the chunk before the next read
+
+                    if resp.status_code in (200, 201):
+                        file_id = _json_loads(resp.content).get('id')
+                        self.log_info(f"Uploaded file '{filename}' with ID: {file_id} (resumable)")
+                        return file_id
+                    if resp.status_code == 308:
+                        # chunk accepted - continue after the last committed byte
+                        committed = resp.headers.get('Range')  # e.g. "bytes=0-1048575"
+                        new_offset = int(committed.rsplit('-', 1)[1]) + 1 if committed else 0
+                        if new_offset > offset:
+                            offset, attempt = new_offset, 0
+                            continue
+                        offset = new_offset
+                    if 400 <= resp.status_code < 500 and resp.status_code not in (408, 429):
+                        self.log_error(f"Failed to upload file (status {resp.status_code}): {resp.text}")
+                        return None
+                    self.log_warning(f"Transient upload error (status {resp.status_code}) - attempt {attempt}/{self.drive_max_retries}")
                 except Exception as exc:
                     self.log_warning(f"Exception during upload attempt {attempt}: {exc}")
 
-                # If not returned, sleep then retry
                 if attempt <= self.drive_max_retries:
-                    backoff = self.drive_retry_delay * (2 ** (attempt - 1))
-                    _time.sleep(backoff)
+                    time.sleep(self.drive_retry_delay * (2 ** (attempt - 1)))
+                    # ask the session how much it already has
+                    try:
+                        status = self._session.put(session_url, headers={**auth_headers, 'Content-Range': f"bytes */{size}"}, timeout=(self.connect_timeout, 30))
+                        if status.status_code in (200, 201):
+                            return _json_loads(status.content).get('id')
+                        committed = status.headers.get('Range')  # e.g. "bytes=0-1048575"
+                        offset = int(committed.rsplit('-', 1)[1]) + 1 if status.status_code == 308 and committed else 0
+                    except Exception as exc:
+                        self.log_warning(f"Couldn't query upload status, restarting from 0: {exc}")
+                        offset = 0
 
             self.log_error(f"Exceeded max retries ({self.drive_max_retries}) uploading file {filename}")
             return None
         except Exception as e:
-            self.log_error(f"Exception uploading file {filename}", e)
+            self.log_error(f"Exception in resumable upload of {filename}", e)
             return None
-    
+
+    def upload_file_path_to_drive(self, path: str, folder_id: Optional[str] = None,
+                                  mime_type: str = "application/octet-stream",
+                                  filename: Optional[str] = None) -> Optional[str]:
+        """Upload a file straight from disk (streamed, never fully loaded) and return its Drive ID."""
+        try:
+            with open(path, "rb") as fh:
+                return self.upload_file_to_drive(fh, filename or os.path.basename(path), folder_id, mime_type)
+        except OSError as e:
+            self.log_error(f"Couldn't open {path} for upload", e)
+            return None
+
+    def bulk_upload_files(
+        self, files: List[Tuple[Union[bytes, BinaryIO], str, Optional[str], str]]
+    ) -> List[Optional[str]]:
+        """Upload several files to Drive concurrently.
+
+        Each item is (file_data, filename, folder_id, mime_type), same as
+        upload_file_to_drive. Returns the file IDs in input order (None for
+        any upload that failed).
+        """
+        futures = [
+            self._executor.submit(self.upload_file_to_drive, file_data, filename, folder_id, mime_type)
+            for file_data, filename, folder_id, mime_type in files
+        ]
+        file_ids = [f.result() for f in futures]
+        self.log_info(f"Bulk uploaded {sum(1 for fid in file_ids if fid)}/{len(files)} files")
+        return file_ids
+
     def get_drive_file_link(self, file_id: str, make_public: bool = True) -> Optional[str]:
         """Get a shareable link for a Google Drive file."""
         try:
@@ -473,7 +1319,7 @@ class GoogleSheetsClient(BaseClient):
                 'type': 'anyone'
             }
             
-            resp = requests.post(url, headers=headers, json=permission, timeout=30)
+            resp = self._drive_session.post(url, headers=headers, data=_json_dumps(permission), params={"fields": "id"}, timeout=(self.connect_timeout, 30))
             
             if resp.status_code == 200:
                 self.log_info(f"Made file {file_id} publicly viewable")
@@ -502,12 +1348,13 @@ class GoogleSheetsClient(BaseClient):
         """
         try:
             self.log_info(f"Searching QnA for query: {query[:50]}...")
+            query_words = self._tokenize(query)
             
             # Try Google Sheets first
             try:
                 sheet_data = self.get_range(sheet_id, "A:E")  # Assuming columns A-E contain QnA data
                 if sheet_data and len(sheet_data) > 1:  # Has header + data
-                    result = self._search_sheet_qna(sheet_data, query)
+                    result = self._search_sheet_qna(sheet_data, query, sheet_id, query_words)
                     if result:
                         return self._format_qna_result(result)
             except Exception as e:
@@ -516,7 +1363,7 @@ class GoogleSheetsClient(BaseClient):
             # Fallback to local data
             if fallback_data:
                 self.log_info("Using fallback QnA data")
-                result = self._search_local_qna(fallback_data, query)
+                result = self._search_local_qna(fallback_data, query, query_words)
                 if result:
                     return self._format_qna_result(result)
             
@@ -526,35 +1373,35 @@ class GoogleSheetsClient(BaseClient):
             self.log_error(f"Error in QnA search for query '{query}'", e)
             return "I encountered an error searching for information. Please try again or contact support."
     
-    def _search_sheet_qna(self, sheet_data: List[List], query: str) -> Optional[Dict]:
+    def _search_sheet_qna(self, sheet_data: List[List], query: str, sheet_id: Optional[str] = None,
+                          query_words: Optional[List[str]] = None) -> Optional[Dict]:
         """Search through Google Sheets QnA data."""
         if not sheet_data or len(sheet_data) < 2:
             return None
         
+        # Lowercased fields / word sets per row are built once per sheet read and
+        # reused (with per-query results) until the cached read itself expires
+        index = self._get_qna_index(sheet_id, sheet_data)
         query_lower = query.lower()
-        query_words = [word.strip('.,?!') for word in query_lower.split() if len(word.strip('.,?!')) > 2]
+        if query_lower in index["results"]:
+            return index["results"][query_lower]
+        
+        if query_words is None:
+            query_words = self._tokenize(query)
         
         best_match = None
         best_score = 0
         
-        # Skip header row, process data rows
-        for row in sheet_data[1:]:
-            if len(row) < 4:  # Need at least ID, Category, Question, Answer
-                continue
-            
-            # Extract fields (adjust indices based on your sheet structure)
-            qna_id = str(row[0]) if len(row) > 0 else ""
-            category = str(row[1]).lower() if len(row) > 1 else ""
-            question = str(row[2]).lower() if len(row) > 2 else ""
-            answer = str(row[3]) if len(row) > 3 else ""
-            keywords = str(row[4]).lower() if len(row) > 4 else ""
-            
-            score = self._calculate_qna_score(query_lower, query_words, question, keywords, category)
+        for row, answer, question, keywords, category, question_words, keyword_words, category_words in index["rows"]:
+            score = self._calculate_qna_score(
+                query_lower, query_words, question, keywords, category,
+                question_words, keyword_words, category_words
+            )
             
             if score > best_score:
                 best_score = score
                 best_match = {
-                    'qna_id': qna_id,
+                    'qna_id': str(row[0]) if len(row) > 0 else "",
                     'category': row[1] if len(row) > 1 else "",
                     'question': row[2] if len(row) > 2 else "",
                     'answer': answer,
@@ -562,12 +1409,42 @@ class GoogleSheetsClient(BaseClient):
                     'score': score
                 }
         
-        return best_match if best_score >= 3 else None  # Minimum score threshold
+        result = best_match if best_score >= 3 else None  # Minimum score threshold
+        index["results"][query_lower] = result
+        return result
     
-    def _search_local_qna(self, qna_data: List[Dict], query: str) -> Optional[Dict]:
+    def _get_qna_index(self, sheet_id: Optional[str], sheet_data: List[List]) -> Dict[str, Any]:
+        """Per-row lowercased fields and word sets for QnA scoring, rebuilt when the sheet data changes."""
+        key = sheet_id or ""
+        index = self._qna_index_cache.get(key)
+        if index is not None and index["data"] is sheet_data:
+            return index
+        
+        rows = []
+        # Skip header row, process data rows
+        for row in sheet_data[1:]:
+            if len(row) < 4:  # Need at least ID, Category, Question, Answer
+                continue
+            
+            # Extract fields (adjust indices based on your sheet structure)
+            category = str(row[1]).lower()
+            question = str(row[2]).lower()
+            keywords = str(row[4]).lower() if len(row) > 4 else ""
+            rows.append((
+                row, str(row[3]).strip(), question, keywords, category,
+                set(question.split()), set(keywords.replace(',', ' ').split()), set(category.split())
+            ))
+        
+        index = {"data": sheet_data, "rows": rows, "results": {}}
+        self._qna_index_cache[key] = index
+        return index
+    
+    def _search_local_qna(self, qna_data: List[Dict], query: str,
+                          query_words: Optional[List[str]] = None) -> Optional[Dict]:
         """Search through local fallback QnA data."""
         query_lower = query.lower()
-        query_words = [word.strip('.,?!') for word in query_lower.split() if len(word.strip('.,?!')) > 2]
+        if query_words is None:
+            query_words = self._tokenize(query)
         
         best_match = None
         best_score = 0
@@ -592,9 +1469,15 @@ class GoogleSheetsClient(BaseClient):
         
         return best_match if best_score >= 3 else None
     
+    def _tokenize(self, text: str) -> List[str]:
+        """Lowercase query words (3+ chars) with surrounding .,?! stripped - each word stripped once."""
+        return [w for w in map(_strip_punct, text.lower().split()) if len(w) > 2]
+    
     def _calculate_qna_score(self, query_lower: str, query_words: List[str], 
-                           question: str, keywords: str, category: str) -> int:
-        """Calculate relevance score for QnA matching."""
+                           question: str, keywords: str, category: str,
+                           question_words: Optional[set] = None, keyword_words: Optional[set] = None,
+                           category_words: Optional[set] = None) -> int:
+        """Calculate relevance score for QnA matching (word sets can be passed in precomputed)."""
         score = 0
         
         # Exact phrase matching (highest priority)
@@ -606,9 +1489,12 @@ class GoogleSheetsClient(BaseClient):
             score += 5
         
         # Word-by-word matching
-        question_words = question.split()
-        keyword_words = keywords.replace(',', ' ').split()
-        category_words = category.split()
+        if question_words is None:
+            question_words = set(question.split())
+        if keyword_words is None:
+            keyword_words = set(keywords.replace(',', ' ').split())
+        if category_words is None:
+            category_words = set(category.split())
         
         for query_word in query_words:
             # Direct word matching
@@ -631,56 +1517,17 @@ class GoogleSheetsClient(BaseClient):
         
         return score
     
-    def _get_word_variations(self, word: str) -> List[str]:
+    def _get_word_variations(self, word: str) -> Tuple[str, ...]:
         """Get word variations for better matching."""
-        variations = {
-            # Air Conditioning
-            'aircond': ['aircon', 'aircond', 'air-cond', 'air conditioning', 'ac', 'a/c', 'cooling'],
-            'aircon': ['aircond', 'air-cond', 'air conditioning', 'ac', 'a/c', 'cooling'],
-            'ac': ['aircon', 'aircond', 'air conditioning', 'cooling'],
-            
-            # Water & Plumbing
-            'leak': ['leaking', 'leaked', 'leaks', 'drip', 'dripping', 'water problem'],
-            'water': ['h2o', 'water supply', 'water pressure', 'tap', 'faucet'],
-            'plumbing': ['pipe', 'pipes', 'drain', 'drainage', 'sewage', 'toilet'],
-            
-            # Electrical
-            'electricity': ['electric', 'electrical', 'power', 'trip', 'tripped', 'blackout'],
-            'electrical': ['electric', 'electricity', 'power', 'wiring', 'socket', 'plug'],
-            'trip': ['tripped', 'circuit breaker', 'main switch', 'db box', 'fuse'],
-            
-            # Internet & Connectivity
-            'wifi': ['wi-fi', 'wireless', 'internet', 'connection', 'network', 'online'],
-            'internet': ['wifi', 'wi-fi', 'connection', 'network', 'online', 'connectivity'],
-            'connection': ['connect', 'connectivity', 'network', 'signal'],
-            
-            # Access & Security
-            'key': ['keys', 'door key', 'room key', 'spare key', 'access'],
-            'card': ['access card', 'keycard', 'lift card', 'scan card', 'building card'],
-            'lock': ['locked', 'unlock', 'door lock', 'digital lock', 'smart lock'],
-            
-            # Maintenance & Repair
-            'repair': ['fix', 'fixing', 'broken', 'damaged', 'not working', 'malfunction'],
-            'maintenance': ['maintain', 'service', 'upkeep', 'servicing', 'repair'],
-            'broken': ['damaged', 'not working', 'spoilt', 'faulty', 'malfunction'],
-            
-            # Common Issues
-            'noise': ['noisy', 'loud', 'sound', 'disturbance'],
-            'smell': ['odor', 'stink', 'bad smell', 'smelly'],
-            'hot': ['warm', 'heating', 'temperature', 'too hot'],
-            'cold': ['cool', 'cooling', 'chilly', 'not cold']
-        }
-        
-        return variations.get(word, [word])
+        return _WORD_VARIATIONS.get(word, (word,))
     
     def _format_qna_result(self, result: Dict) -> str:
         """Format QnA search result for display (insides style: show full answer, no forced bullets or truncation)."""
         if not result:
             return "No answer found."
-        question = result.get('question', '')
-        answer = result.get('answer', '')
-        # Show question and full answer, no forced bullet points or truncation
-        return f"{answer.strip()}"
+        # Full answer, no forced bullet points or truncation (sheet answers come pre-stripped,
+        # and strip() hands back the same string when there's nothing to trim)
+        return result.get('answer', '').strip()
     
     def _make_answer_concise(self, answer: str, max_points: int = 4, max_words_per_point: int = 15) -> str:
         """(Insides style) Return answer as-is, no forced bullet points or truncation."""
@@ -707,13 +1554,14 @@ class GoogleSheetsClient(BaseClient):
         """
         try:
             # First append the basic row
-            if not self.append_row(sheet_name, row, sheet_id):
+            last_row = self._append_row(sheet_name, row, sheet_id)
+            if last_row is None:
                 return False
             
-            # Then update the link cell with rich text
-            # Get the last row number by reading the sheet
-            data = self.read_range(f"{sheet_name}!A:A", sheet_id, use_cache=False)
-            last_row = len(data)
+            # Then update the link cell with rich text, on the row the append reported
+            if not last_row:
+                # response had no updatedRange - fall back to counting the rows
+                last_row = len(self.read_range(f"{sheet_name}!A:A", sheet_id, use_cache=False))
             
             return self.update_rich_link_cell(sheet_name, last_row, link_col_idx + 1, 
                                             link_url, link_text, sheet_id)
@@ -722,6 +1570,62 @@ class GoogleSheetsClient(BaseClient):
             self.log_error(f"Failed to append row with rich link in {sheet_name}", e)
             return False
     
+    @staticmethod
+    def _cell_value_request(gid: int, row: int, col: int, user_entered_value: Dict[str, Any]) -> Dict[str, Any]:
+        """updateCells request setting one cell's userEnteredValue (row/col are 1-based)."""
+        return {
+            "updateCells": {
+                "rows": [{"values": [{"userEnteredValue": user_entered_value}]}],
+                "fields": "userEnteredValue",
+                "start": {"sheetId": gid, "rowIndex": row - 1, "columnIndex": col - 1},
+            }
+        }
+
+    def _link_cell_request(self, gid: int, row: int, col: int, link_url: str, link_text: str,
+                           as_formula: bool = False) -> Dict[str, Any]:
+        """updateCells request for a link cell: plain text with a native link run, or a HYPERLINK formula."""
+        if as_formula:
+            return self._cell_value_request(gid, row, col, {"formulaValue": f'=HYPERLINK("{link_url}","{link_text}")'})
+        # stored as text + link format, so Sheets has no formula to evaluate
+        req = self._cell_value_request(gid, row, col, {"stringValue": link_text})
+        req["updateCells"]["rows"][0]["values"][0]["textFormatRuns"] = [
+            {"startIndex": 0, "format": {"link": {"uri": link_url}}}
+        ]
+        req["updateCells"]["fields"] = "userEnteredValue,textFormatRuns"
+        return req
+
+    def _post_link_update(self, sid: str, sheet_name: str, headers: Dict[str, str], build_requests) -> Optional[requests.Response]:
+        """
+        POST a batchUpdate built by build_requests(gid, as_formula) with native links.
+
+        A stale cached gid ("No grid with id", e.g. the tab was recreated) is refreshed
+        and retried once; if Sheets rejects the textFormatRuns link itself, it is retried
+        once with HYPERLINK formulas. Returns None if the tab can't be found.
+        """
+        gid = self._get_gid(sid, sheet_name)
+        if gid is None:
+            self.log_error(f"Could not find sheet ID for sheet: {sheet_name}")
+            return None
+
+        url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}:batchUpdate"
+
+        def post(as_formula: bool) -> requests.Response:
+            return self._session.post(url, headers=headers, data=_json_dumps({"requests": build_requests(gid, as_formula)}),
+                                      timeout=(self.connect_timeout, 30))
+
+        resp = post(False)
+        if resp.status_code == 400 and "No grid with id" in resp.text:
+            self.log_warning(f"Cached gid {gid} for {sheet_name} is stale, refreshing")
+            gid = self._cached_sheet_gids(sid, refresh=True).get(sheet_name)
+            if gid is None:
+                self.log_error(f"Could not find sheet ID for sheet: {sheet_name}")
+                return resp
+            resp = post(False)
+        if resp.status_code == 400 and "textFormatRuns" in resp.text:
+            self.log_warning(f"Native link rejected ({resp.text}), falling back to HYPERLINK formula")
+            resp = post(True)
+        return resp
+
     def update_rich_link_cell(self, sheet_name: str, row: int, col: int, 
                             link_url: str, link_text: str, 
                             sheet_id: Optional[str] = None) -> bool:
@@ -752,44 +1656,15 @@ class GoogleSheetsClient(BaseClient):
             col_letter = self._colnum_to_letter(col)
             cell_range = f"{sheet_name}!{col_letter}{row}"
             
-            # Use batchUpdate with rich text format
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{sid}:batchUpdate"
-            
-            # Get sheet ID for the specific sheet name
-            sheet_info = self.get_sheet_info(sid)
-            target_sheet_id = None
-            for sheet in sheet_info.get('sheets', []):
-                if sheet.get('title') == sheet_name:
-                    target_sheet_id = sheet.get('sheet_id')
-                    break
+            # Use batchUpdate with a rich text link
+            resp = self._post_link_update(sid, sheet_name, headers, lambda gid, as_formula: [
+                self._link_cell_request(gid, row, col, link_url, link_text, as_formula)
+            ])
             
-            if target_sheet_id is None:
-                self.log_error(f"Could not find sheet ID for sheet: {sheet_name}")
+            if resp is None:
                 return False
-            
-            requests_payload = [{
-                "updateCells": {
-                    "rows": [{
-                        "values": [{
-                            "userEnteredValue": {
-                                "formulaValue": f'=HYPERLINK("{link_url}","{link_text}")'
-                            }
-                        }]
-                    }],
-                    "fields": "userEnteredValue",
-                    "start": {
-                        "sheetId": target_sheet_id,
-                        "rowIndex": row - 1,
-                        "columnIndex": col - 1
-                    }
-                }
-            }]
-            
-            payload = {"requests": requests_payload}
-            resp = requests.post(url, headers=headers, json=payload, timeout=30)
-            
             if resp.status_code == 200:
-                self._invalidate_cache(sid)
+                self._invalidate_ranges(sid, [cell_range])
                 self.log_info(f"Updated cell {cell_range} with rich link: {link_text}")
                 return True
             else:
@@ -821,15 +1696,36 @@ class GoogleSheetsClient(BaseClient):
         Returns:
             bool: Success status
         """
+        sid = sheet_id or self.default_sheet_id
+        if not sid:
+            self.log_error("update_file_link_and_timestamp: no sheet id configured")
+            return False
+
         try:
-            # Update the link cell
-            if not self.update_rich_link_cell(sheet_name, row, link_col, link_url, link_text, sheet_id):
+            headers = self._get_headers()
+            if not headers:
                 return False
-            
-            # Update timestamp in the specified column
+
+            # Link and timestamp go in one batchUpdate (one round trip, one quota unit)
             current_time = datetime.now().strftime(timestamp_format)
-            return self.update_cell(sheet_name, row, timestamp_col, current_time, sheet_id)
-            
+            resp = self._post_link_update(sid, sheet_name, headers, lambda gid, as_formula: [
+                self._link_cell_request(gid, row, link_col, link_url, link_text, as_formula),
+                self._cell_value_request(gid, row, timestamp_col, {"stringValue": current_time}),
+            ])
+
+            if resp is None:
+                return False
+            if resp.status_code == 200:
+                self._invalidate_ranges(sid, [
+                    f"{sheet_name}!{self._colnum_to_letter(link_col)}{row}",
+                    f"{sheet_name}!{self._colnum_to_letter(timestamp_col)}{row}",
+                ])
+                self.log_info(f"Updated link and timestamp in {sheet_name} row {row}")
+                return True
+            else:
+                self.log_error(f"update_file_link_and_timestamp failed: {resp.status_code} {resp.text}")
+                return False
+
         except Exception as e:
             self.log_error(f"Failed to update file link and timestamp in {sheet_name} row {row}", e)
             return False
@@ -898,8 +1794,9 @@ class GoogleSheetsClient(BaseClient):
             str: Resolved sheet name that exists in the spreadsheet
         """
         try:
-            sheet_info = self.get_sheet_info(sheet_id)
-            available_sheets = [sheet.get('title', '') for sheet in sheet_info.get('sheets', [])]
+            # tab titles come from the cached name -> gid map (no full metadata fetch)
+            sid = sheet_id or self.default_sheet_id
+            available_sheets = list(self._cached_sheet_gids(sid)) if sid else []
             
             if not available_sheets:
                 self.log_warning("No sheets found in spreadsheet")
@@ -920,15 +1817,16 @@ class GoogleSheetsClient(BaseClient):
             ]
             
             # Check each pattern
+            available_set = set(available_sheets)
             for pattern in patterns_to_try:
-                if pattern in available_sheets:
+                if pattern in available_set:
                     self.log_info(f"Resolved sheet name: {pattern}")
                     return pattern
             
-            # Try partial matching (case insensitive)
+            # Try partial matching (case insensitive; a prefix match is also a substring match)
             base_lower = base_name.lower()
             for sheet_name in available_sheets:
-                if base_lower in sheet_name.lower() or sheet_name.lower().startswith(base_lower):
+                if base_lower in sheet_name.lower():
                     self.log_info(f"Resolved sheet name via partial match: {sheet_name}")
                     return sheet_name
             
@@ -978,7 +1876,7 @@ class GoogleSheetsClient(BaseClient):
 
     # === BULK DATA OPERATIONS ===
     
-    def append_bulk_data(self, sheet_name: str, data_rows: List[List[Any]], 
+    def append_bulk_data(self, sheet_name: str, data_rows: Iterable[List[Any]], 
                         sheet_id: Optional[str] = None,
                         value_input_option: str = "RAW",
                         validate_data: bool = True,
@@ -988,7 +1886,9 @@ class GoogleSheetsClient(BaseClient):
         
         Args:
             sheet_name: Name of the sheet to append to
-            data_rows: List of row data (each row is a list of values)
+            data_rows: Row data (each row is a list of values). A list is validated
+                       up front; any other iterable (e.g. a generator) is streamed
+                       chunk by chunk and each chunk is validated before it's sent
             sheet_id: Optional sheet ID
             value_input_option: "RAW" or "USER_ENTERED"
             validate_data: Whether to validate data before insertion
@@ -997,30 +1897,47 @@ class GoogleSheetsClient(BaseClient):
         Returns:
             bool: Success status
         """
-        if not data_rows:
+        streaming = not isinstance(data_rows, (list, tuple))
+        if not streaming and not data_rows:
             self.log_warning("append_bulk_data: no data provided")
             return True
         
         try:
             # Validate data if requested
-            if validate_data:
+            if validate_data and not streaming:
                 for i, row in enumerate(data_rows):
                     if not self.validate_row_data(row):
                         self.log_error(f"Data validation failed for row {i}: {row}")
                         return False
             
-            # Process data in chunks for large datasets
-            total_rows = len(data_rows)
+            # Process data in chunks for large datasets (islice pulls each chunk
+            # straight off the iterator, so generators never get materialized)
+            total_rows = 0
             success = True
             
-            for i in range(0, total_rows, chunk_size):
-                chunk = data_rows[i:i + chunk_size]
+            rows_iter = iter(data_rows)
+            for n in itertools.count(1):
+                chunk = list(itertools.islice(rows_iter, chunk_size))
+                if not chunk:
+                    break
+                
+                if validate_data and streaming:
+                    for i, row in enumerate(chunk, start=total_rows):
+                        if not self.validate_row_data(row):
+                            self.log_error(f"Data validation failed for row {i}: {row}")
+                            return False
+                
                 chunk_success = self._append_data_chunk(sheet_name, chunk, sheet_id, value_input_option)
                 if not chunk_success:
                     success = False
                     break
                 
-                self.log_info(f"Processed chunk {i//chunk_size + 1}: {len(chunk)} rows")
+                total_rows += len(chunk)
+                self.log_info(f"Processed chunk {n}: {len(chunk)} rows")
+            
+            if streaming and not total_rows and success:
+                self.log_warning("append_bulk_data: no data provided")
+                return True
             
             if success:
                 self.log_info(f"Successfully appended {total_rows} rows to {sheet_name}")
@@ -1047,10 +1964,10 @@ class GoogleSheetsClient(BaseClient):
             payload = {"values": chunk, "majorDimension": "ROWS"}
             params = {"valueInputOption": value_input_option, "insertDataOption": "INSERT_ROWS"}
 
-            resp = requests.post(url, headers=headers, json=payload, params=params, timeout=60)
+            resp = self._session.post(url, headers=headers, data=_json_dumps(payload), params=params, timeout=(self.connect_timeout, 60))
 
             if resp.status_code == 200:
-                self._invalidate_cache(sid)
+                self._invalidate_ranges(sid, [_whole_tab(sheet_name)])
                 return True
             else:
                 self.log_error(f"_append_data_chunk failed: {resp.status_code} {resp.text}")
@@ -1062,60 +1979,180 @@ class GoogleSheetsClient(BaseClient):
 
     def bulk_update_cells(self, updates: List[Dict[str, Any]], 
                          sheet_id: Optional[str] = None,
-                         chunk_size: int = 100) -> bool:
+                         chunk_size: int = 100) -> BulkUpdateResult:
         """
         Perform bulk cell updates efficiently.
         
         Args:
             updates: List of update dictionaries with 'sheet_name', 'row', 'col', 'value'
             sheet_id: Optional sheet ID
-            chunk_size: Number of updates to process in each batch
+            chunk_size: Max number of cells written per batch request
             
         Returns:
-            bool: Success status
+            BulkUpdateResult: truthy only if every chunk was written. When there is
+            more than one chunk they are sent concurrently, so a failure is NOT
+            all-or-nothing: chunks already sent stay written (see landed_ranges /
+            failed_ranges) and no further chunks are started.
         """
         if not updates:
-            return True
+            return BulkUpdateResult(True)
         
+        chunks: List[List[Dict[str, Any]]] = []
+        landed: List[int] = []
         try:
             # Group updates by batch for efficiency
             total_updates = len(updates)
             success = True
             
-            for i in range(0, total_updates, chunk_size):
-                chunk = updates[i:i + chunk_size]
-                
-                # Convert to batch update format
-                batch_updates = []
-                for update in chunk:
-                    sheet_name = update.get('sheet_name', '')
-                    row = update.get('row', 1)
-                    col = update.get('col', 1)
-                    value = update.get('value', '')
-                    
-                    col_letter = self._colnum_to_letter(col)
-                    range_name = f"{sheet_name}!{col_letter}{row}"
+            # Convert to batch update format: last value per cell wins, and adjacent
+            # cells are merged into rectangular ranges (fewer, bigger ValueRanges)
+            cells: Dict[Tuple[str, int, int], Any] = {}
+            for update in updates:
+                cell = (update.get('sheet_name', ''), int(update.get('row', 1)), int(update.get('col', 1)))
+                cells[cell] = update.get('value', '')
+            batch_updates = self._coalesce_cell_updates(cells, max_cells=chunk_size)
+            
+            # Pack ranges into chunks of at most chunk_size cells
+            chunk_cells = 0
+            for upd in batch_updates:
+                n_cells = sum(len(row) for row in upd["values"])
+                if not chunks or chunk_cells + n_cells > chunk_size:
+                    chunks.append([])
+                    chunk_cells = 0
+                chunks[-1].append(upd)
+                chunk_cells += n_cells
+            
+            # Ranges no longer overlap after the merge, so chunks are order-independent
+            # and can go out concurrently
+            if len(chunks) > 1:
+                results = self._run_write_chunks(
+                    [lambda chunk=chunk: self.batch_update(chunk, sheet_id) for chunk in chunks]
+                )
+                landed = [n for n, ok in enumerate(results) if ok]
+                success = len(landed) == len(chunks)
+                if success:
+                    self.log_info(f"Processed {len(chunks)} update chunks concurrently")
+            else:
+                for n, chunk in enumerate(chunks):
+                    chunk_success = self.batch_update(chunk, sheet_id)
+                    if not chunk_success:
+                        success = False
+                        break
                     
-                    batch_updates.append({
-                        "range": range_name,
-                        "values": [[value]]
-                    })
-                
-                chunk_success = self.batch_update(batch_updates, sheet_id)
-                if not chunk_success:
-                    success = False
-                    break
-                
-                self.log_info(f"Processed update chunk {i//chunk_size + 1}: {len(chunk)} updates")
+                    landed.append(n)
+                    self.log_info(f"Processed update chunk {n + 1}: {len(chunk)} ranges")
             
             if success:
                 self.log_info(f"Successfully processed {total_updates} bulk updates")
-            
-            return success
+            else:
+                self.log_error(f"Bulk update incomplete: {len(landed)}/{len(chunks)} chunks written")
             
         except Exception as e:
             self.log_error("Error in bulk cell updates", e)
-            return False
+            success = False
+        
+        return BulkUpdateResult(success, [[upd["range"] for upd in chunk] for chunk in chunks], landed)
+
+    def _coalesce_cell_updates(self, cells: Dict[Tuple[str, int, int], Any],
+                               max_cells: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Merge {(sheet, row, col): value} into ValueRanges covering runs/rectangles of adjacent cells.
+
+        With max_cells, no single range holds more than that many cells.
+        """
+        limit = max(1, max_cells) if max_cells else None
+        # 1) horizontal runs of consecutive columns within a row
+        runs: List[List[Any]] = []  # [sheet, row, first col, last col, values]
+        for sheet_name, row, col in sorted(cells):
+            last = runs[-1] if runs else None
+            if (last and last[0] == sheet_name and last[1] == row and last[3] + 1 == col
+                    and (limit is None or len(last[4]) < limit)):
+                last[3] = col
+                last[4].append(cells[(sheet_name, row, col)])
+            else:
+                runs.append([sheet_name, row, col, col, [cells[(sheet_name, row, col)]]])
+        
+        # 2) stack runs spanning the same columns on consecutive rows
+        blocks: List[List[Any]] = []  # [sheet, first row, last row, first col, last col, rows]
+        open_blocks: Dict[Tuple[str, int, int], List[Any]] = {}
+        for sheet_name, row, c0, c1, values in runs:
+            block = open_blocks.get((sheet_name, c0, c1))
+            if (block is not None and block[2] + 1 == row
+                    and (limit is None or (len(block[5]) + 1) * len(values) <= limit)):
+                block[2] = row
+                block[5].append(values)
+            else:
+                block = [sheet_name, row, row, c0, c1, [values]]
+                blocks.append(block)
+                open_blocks[(sheet_name, c0, c1)] = block
+        
+        batch_updates = []
+        for sheet_name, r0, r1, c0, c1, rows in blocks:
+            start = f"{self._colnum_to_letter(c0)}{r0}"
+            end = f"{self._colnum_to_letter(c1)}{r1}"
+            batch_updates.append({
+                "range": f"{sheet_name}!{start}" if start == end else f"{sheet_name}!{start}:{end}",
+                "values": rows
+            })
+        return batch_updates
+
+    async def abulk_update_cells(self, updates: List[Dict[str, Any]],
+                                 sheet_id: Optional[str] = None,
+                                 chunk_size: int = 100) -> BulkUpdateResult:
+        """Awaitable bulk_update_cells (same args/result), doesn't block the event loop."""
+        # runs on the loop's default executor, not self._executor: the chunks
+        # themselves fan out on self._executor and must not wait behind this call
+        return await asyncio.to_thread(self.bulk_update_cells, updates, sheet_id, chunk_size)
+
+    async def aappend_bulk_data(self, sheet_name: str, data_rows: List[List[Any]],
+                                sheet_id: Optional[str] = None,
+                                value_input_option: str = "RAW",
+                                validate_data: bool = True,
+                                chunk_size: int = 1000) -> bool:
+        """Awaitable append_bulk_data (same args/result), doesn't block the event loop."""
+        return await asyncio.to_thread(
+            self.append_bulk_data, sheet_name, data_rows, sheet_id, value_input_option, validate_data, chunk_size
+        )
+
+    def _throttle_write(self) -> None:
+        """Take a write token, blocking only once the burst allowance is used up (shared across threads)."""
+        if self.write_rate_per_min <= 0:
+            return
+        per_sec = self.write_rate_per_min / 60.0
+        with self._write_throttle_lock:
+            now = time.monotonic()
+            self._write_tokens = min(self.write_burst, self._write_tokens + (now - self._write_tokens_at) * per_sec)
+            self._write_tokens_at = now
+            # Reserve the token even if it isn't there yet, so waiters queue up in order
+            self._write_tokens -= 1
+            delay = -self._write_tokens / per_sec if self._write_tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+    def _run_write_chunks(self, tasks: List[Any]) -> List[bool]:
+        """Run independent write callables on the pool (rate limited); stop scheduling on the first failure.
+
+        Returns one flag per task, True only for the ones that ran and succeeded.
+        """
+        failed = threading.Event()
+
+        def run(task) -> bool:
+            if failed.is_set():
+                return False
+            self._throttle_write()
+            if failed.is_set():
+                return False
+            ok = task()
+            if not ok:
+                failed.set()
+            return ok
+
+        futures = [self._executor.submit(run, task) for task in tasks]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for f in pending:
+            f.cancel()
+        # let chunks already in flight finish, so the flags say what actually landed
+        wait(pending)
+        return [not f.cancelled() and f.exception() is None and bool(f.result()) for f in futures]
 
     # === DATA VALIDATION UTILITIES ===
     
@@ -1141,20 +2178,24 @@ class GoogleSheetsClient(BaseClient):
                 self.log_error(f"Row has too many columns: {len(row)} > {max_col_count}")
                 return False
             
-            for i, cell in enumerate(row):
-                # Convert to string to check length
-                cell_str = str(cell) if cell is not None else ""
-                
-                if len(cell_str) > max_cell_length:
-                    self.log_error(f"Cell {i} exceeds maximum length: {len(cell_str)} > {max_cell_length}")
-                    return False
-                
-                # Check for problematic characters that might break Google Sheets
-                if '\x00' in cell_str:  # Null character
-                    self.log_error(f"Cell {i} contains null character")
-                    return False
+            # One pass over the cell texts, stopping at the first bad one; numbers
+            # can't be too long or hold a null character so they're never str()'d
+            bad = next(
+                (
+                    (i, cell_str) for i, cell_str in enumerate(map(_cell_text, row))
+                    if len(cell_str) > max_cell_length or '\x00' in cell_str  # Null character breaks Sheets
+                ),
+                None,
+            )
+            if bad is None:
+                return True
             
-            return True
+            i, cell_str = bad
+            if len(cell_str) > max_cell_length:
+                self.log_error(f"Cell {i} exceeds maximum length: {len(cell_str)} > {max_cell_length}")
+            else:
+                self.log_error(f"Cell {i} contains null character")
+            return False
             
         except Exception as e:
             self.log_error("Error validating row data", e)
@@ -1176,25 +2217,26 @@ class GoogleSheetsClient(BaseClient):
                 return []
             
             sanitized = []
+            append = sanitized.append
             for cell in row:
                 if cell is None:
-                    sanitized.append("")
+                    append("")
+                elif isinstance(cell, (int, float, bool)):
+                    # Numbers/booleans pass through untouched (no string round trip)
+                    append(cell)
                 else:
                     # Convert to string and sanitize
                     cell_str = str(cell)
                     
                     # Remove null characters
-                    cell_str = cell_str.replace('\x00', '')
+                    if '\x00' in cell_str:
+                        cell_str = cell_str.replace('\x00', '')
                     
                     # Truncate if too long
                     if len(cell_str) > max_cell_length:
                         cell_str = cell_str[:max_cell_length - 3] + "..."
                     
-                    # Handle special cases for numbers/booleans
-                    if isinstance(cell, (int, float, bool)):
-                        sanitized.append(cell)
-                    else:
-                        sanitized.append(cell_str)
+                    append(cell_str)
             
             return sanitized
             
@@ -1213,12 +2255,7 @@ class GoogleSheetsClient(BaseClient):
             bool: True if range format is valid
         """
         try:
-            import re
-            
-            # Pattern for sheet range: [SheetName!]A1:B10 or [SheetName!]A:B or [SheetName!]1:10
-            pattern = r'^(?:[^!]+!)?[A-Z]+\d*:[A-Z]+\d*$|^(?:[^!]+!)?[A-Z]+:[A-Z]+$|^(?:[^!]+!)?\d+:\d+$'
-            
-            if re.match(pattern, range_str.strip()):
+            if _SHEET_RANGE_RE.match(range_str.strip()):
                 return True
             else:
                 self.log_error(f"Invalid range format: {range_str}")
@@ -1262,21 +2299,16 @@ class GoogleSheetsClient(BaseClient):
                 self.log_error("get_config_value: no sheet id configured")
                 return None
             
-            # Read Config sheet (A:B columns, first 50 rows should be enough)
-            rows = self.read_range(f"{sheet_name}!A1:B50", sid, use_cache=False)
-            if not rows:
+            config = self._load_config_map(sid, sheet_name)
+            if config is None:
                 self.log_warning(f"Config sheet '{sheet_name}' is empty")
                 return None
             
-            # Search for the key (case-insensitive)
-            key_lower = key.strip().lower()
-            for row in rows:
-                if len(row) >= 2:
-                    row_key = str(row[0]).strip().lower()
-                    if row_key == key_lower:
-                        value = str(row[1]).strip()
-                        self.log_info(f"Found config value for '{key}': {value}")
-                        return value
+            # Look up the key (case-insensitive)
+            value = config.get(key.strip().lower())
+            if value is not None:
+                self.log_info(f"Found config value for '{key}': {value}")
+                return value
             
             self.log_warning(f"Config key '{key}' not found in sheet '{sheet_name}'")
             return None
@@ -1285,6 +2317,62 @@ class GoogleSheetsClient(BaseClient):
             self.log_error(f"Error getting config value '{key}'", e)
             return None
 
+    def get_config_values(self, keys: List[str], sheet_name: str = "Config",
+                          sheet_id: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Get several configuration values with a single Config sheet read.
+        
+        Args:
+            keys: Configuration keys to look for (case-insensitive)
+            sheet_name: Name of the config sheet (default: "Config")
+            sheet_id: Optional sheet ID (uses default if not provided)
+            
+        Returns:
+            Dict of each requested key to its value (None if not found)
+        """
+        try:
+            sid = sheet_id or self.default_sheet_id
+            if not sid:
+                self.log_error("get_config_values: no sheet id configured")
+                return {key: None for key in keys}
+            
+            config = self._load_config_map(sid, sheet_name) or {}
+            return {key: config.get(key.strip().lower()) for key in keys}
+            
+        except Exception as e:
+            self.log_error(f"Error getting config values {keys}", e)
+            return {key: None for key in keys}
+
+    def _load_config_map(self, sid: str, sheet_name: str) -> Optional[Dict[str, str]]:
+        """{key lower: value} for a Config sheet, re-read at most every config_cache_ttl seconds (None if empty)."""
+        entry = self._config_entry(sid, sheet_name)
+        return entry[1] if entry else None
+
+    def _config_entry(self, sid: str, sheet_name: str) -> Optional[Tuple[float, Dict[str, str], Dict[str, int]]]:
+        """(loaded at, {key lower: value}, {key lower: 1-based row}) for a Config sheet, None if it's empty."""
+        with self._config_lock:
+            cached = self._config_cache.get(sid, {}).get(sheet_name)
+        if cached and time.time() - cached[0] < self.config_cache_ttl:
+            return cached
+        
+        # Read Config sheet (A:B columns, first 50 rows should be enough)
+        rows = self.read_range(f"{sheet_name}!A1:B50", sid, use_cache=False)
+        if not rows:
+            return None
+        
+        config: Dict[str, str] = {}
+        row_of: Dict[str, int] = {}
+        for i, row in enumerate(rows, start=1):
+            if len(row) >= 1:
+                row_key = str(row[0]).strip().lower()
+                row_of.setdefault(row_key, i)  # first row wins
+                if len(row) >= 2:
+                    config.setdefault(row_key, str(row[1]).strip())
+        entry = (time.time(), config, row_of)
+        with self._config_lock:
+            self._config_cache.setdefault(sid, {})[sheet_name] = entry
+        return entry
+
     def update_config_value(self, key: str, value: str, sheet_name: str = "Config", sheet_id: Optional[str] = None) -> bool:
         """
         Update a configuration value in the Config sheet.
@@ -1305,36 +2393,26 @@ class GoogleSheetsClient(BaseClient):
                 self.log_error("update_config_value: no sheet id configured")
                 return False
             
-            # Read current config
-            rows = self.read_range(f"{sheet_name}!A1:B50", sid, use_cache=False)
-            if not rows:
-                # Empty sheet, append first row
-                success = self.append_row(sheet_name, [key, value], sid)
+            # Current config (cached map, so no re-read when it's fresh)
+            entry = self._config_entry(sid, sheet_name)
+            key_lower = key.strip().lower()
+            
+            row_index = entry[2].get(key_lower) if entry else None
+            if row_index:
+                # Found the key, update its value
+                range_str = f"{sheet_name}!B{row_index}:B{row_index}"
+                success = self.write_range(range_str, [[value]], sid, value_input_option="USER_ENTERED")
                 if success:
-                    self.log_info(f"Added new config key '{key}' with value '{value}'")
+                    # The write dropped the cached map; the next read sees the value
+                    # as the sheet parsed it (USER_ENTERED)
+                    self.log_info(f"Updated config key '{key}' to value '{value}'")
                 return success
             
-            # Search for existing key
-            key_lower = key.strip().lower()
-            for i, row in enumerate(rows):
-                if len(row) >= 1:
-                    row_key = str(row[0]).strip().lower()
-                    if row_key == key_lower:
-                        # Found the key, update its value
-                        row_index = i + 1  # 1-based index
-                        range_str = f"{sheet_name}!B{row_index}:B{row_index}"
-                        success = self.write_range(range_str, [[value]], sid, value_input_option="USER_ENTERED")
-                        if success:
-                            self.log_info(f"Updated config key '{key}' to value '{value}'")
-                            # Invalidate cache for this sheet
-                            self._invalidate_cache(sid)
-                        return success
-            
-            # Key not found, append new row
-            success = self.append_row(sheet_name, [key, value], sid)
-            if success:
-                self.log_info(f"Added new config key '{key}' with value '{value}'")
-            return success
+            # Key not found (or empty sheet), append new row
+            if self._append_row(sheet_name, [key, value], sid) is None:
+                return False
+            self.log_info(f"Added new config key '{key}' with value '{value}'")
+            return True
             
         except Exception as e:
             self.log_error(f"Error updating config value '{key}'", e)
@@ -1384,38 +2462,37 @@ class GoogleSheetsClient(BaseClient):
         Returns:
             Credentials object with valid token
         """
+        # Fast path: the background refresher keeps cached credentials valid
+        creds = self._credentials
+        if creds is not None and creds.valid:
+            return creds
+
         try:
-            # Create credentials if not cached
-            if self._credentials is None:
-                from google.oauth2.service_account import Credentials
+            with self._creds_lock:
+                # Create credentials if not cached
+                if self._credentials is None:
+                    from google.oauth2.service_account import Credentials
+
+                    self._credentials = Credentials.from_service_account_info(
+                        self._service_account_info(),
+                        scopes=[
+                            "https://www.googleapis.com/auth/spreadsheets",
+                            "https://www.googleapis.com/auth/drive",
+                        ],
+                    )
+                    self.log_info("Credentials initialized")
 
-                # Load service account credentials
-                if self.service_account_file.strip().startswith("{"):
-                    creds_data = json.loads(self.service_account_file)
-                else:
-                    with open(self.service_account_file, "r", encoding="utf-8") as fh:
-                        creds_data = json.load(fh)
-
-                self._credentials = Credentials.from_service_account_info(
-                    creds_data,
-                    scopes=[
-                        "https://www.googleapis.com/auth/spreadsheets",
-                        "https://www.googleapis.com/auth/drive",
-                    ],
-                )
-                self.log_info("Credentials initialized")
+                # IMPORTANT: Always refresh credentials before use to ensure valid token
+                # Service account credentials need to be refreshed to get an access token
+                import google.auth.transport.requests as auth_requests
 
-            # IMPORTANT: Always refresh credentials before use to ensure valid token
-            # Service account credentials need to be refreshed to get an access token
-            import google.auth.transport.requests as auth_requests
+                # Check if credentials need refresh (expired or no token yet)
+                if not self._credentials.valid:
+                    self.log_info("Refreshing credentials (expired or not yet valid)")
+                    self._credentials.refresh(auth_requests.Request())
+                    self.log_info("Credentials refreshed successfully")
 
-            # Check if credentials need refresh (expired or no token yet)
-            if not self._credentials.valid:
-                self.log_info("Refreshing credentials (expired or not yet valid)")
-                self._credentials.refresh(auth_requests.Request())
-                self.log_info("Credentials refreshed successfully")
-
-            return self._credentials
+                return self._credentials
 
         except Exception as e:
             self.log_error("Error getting/refreshing credentials", e)
@@ -1423,6 +2500,43 @@ class GoogleSheetsClient(BaseClient):
             self._credentials = None
             return None
 
+    def _get_api(self, name: str, version: str):
+        """Discovery client for one Google API, built once per client and cached (None if unavailable)."""
+        key = (name, version)
+        service = self._services.get(key)
+        if service is not None:
+            return service
+
+        if build is None:
+            self.log_error(f"Cannot create {name.capitalize()} {version} service: google-api-python-client is not installed")
+            return None
+
+        with self._service_lock:
+            key_lock = self._service_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have finished the build while we waited
+            service = self._services.get(key)
+            if service is not None:
+                return service
+
+            credentials = self.get_credentials()  # logs and returns None on failure
+            if not credentials:
+                return None
+
+            try:
+                # Discovery docs bundled with google-api-python-client (>= 2.0) - no HTTPS
+                # fetch of the discovery document on cold start
+                service = build(name, version, credentials=credentials,
+                                static_discovery=True, cache_discovery=False)
+            except (GoogleApiError, ValueError) as e:
+                self.log_error(f"Error creating {name.capitalize()} {version} service", e)
+                return None
+            self._services[key] = service
+
+        self.log_info(f"{name.capitalize()} {version} service initialized")
+        return service
+
     def get_service(self):
         """
         Get Google Sheets API service client.
@@ -1430,22 +2544,33 @@ class GoogleSheetsClient(BaseClient):
         Returns:
             Sheets service object
         """
-        if self._sheets_service is None:
-            try:
-                from googleapiclient.discovery import build
+        return self._get_api('sheets', 'v4')
 
-                credentials = self.get_credentials()
-                if not credentials:
-                    return None
+    def prewarm(self, block: bool = True) -> None:
+        """Build the Sheets and Drive clients on the worker pool (call at app startup).
 
-                self._sheets_service = build('sheets', 'v4', credentials=credentials)
-                self.log_info("Sheets service initialized")
+        With block=False this returns immediately and the first get_service() /
+        get_drive_service() call picks up whatever has finished by then.
+        """
+        futures = [self._executor.submit(self._get_api, name, version)
+                   for name, version in (('sheets', 'v4'), ('drive', 'v3'))]
+        if block:
+            wait(futures)
 
-            except Exception as e:
-                self.log_error("Error creating Sheets service", e)
-                return None
+    def new_batch(self, callback=None, api: str = "sheets"):
+        """Return a BatchHttpRequest for the Sheets or Drive service (None if the service isn't available).
+
+        Usage:
+            b = sheets.new_batch(callback=on_result, api="drive")
+            b.add(sheets.get_drive_service().files().get(fileId=fid, fields="id,name"))
+            b.execute()
 
-        return self._sheets_service
+        Google retired the global batch endpoint, so one batch can only hold calls for one API.
+        """
+        service = self.get_drive_service() if api == "drive" else self.get_service()
+        if service is None:
+            return None
+        return service.new_batch_http_request(callback=callback)
 
     def get_drive_service(self):
         """
@@ -1454,19 +2579,4 @@ class GoogleSheetsClient(BaseClient):
         Returns:
             Drive service object
         """
-        if self._drive_service is None:
-            try:
-                from googleapiclient.discovery import build
-
-                credentials = self.get_credentials()
-                if not credentials:
-                    return None
-
-                self._drive_service = build('drive', 'v3', credentials=credentials)
-                self.log_info("Drive service initialized")
-
-            except Exception as e:
-                self.log_error("Error creating Drive service", e)
-                return None
-
-        return self._drive_service
\ No newline at end of file
+        return self._get_api('drive', 'v3')
\ No newline at end of file
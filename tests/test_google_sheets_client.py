@@ -0,0 +1,226 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("requests")
+
+# google_sheets_client ships in the chatbot_core layer (it imports .base_client),
+# so load it the same way lambda_function does
+_FUNCTIONS = os.path.join(os.path.dirname(__file__), "..", "Functions")
+for _layer in ("chatbot_core_layer", "chatbot-core-layer"):
+    sys.path.insert(0, os.path.join(_FUNCTIONS, _layer, "python"))
+
+gsc = pytest.importorskip("chatbot_core.google_sheets_client")
+
+
+def _client(**attrs):
+    """GoogleSheetsClient without __init__ (no config or credentials), holding only the given state."""
+    client = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    client.__dict__.update(attrs)
+    return client
+
+
+QNA_SHEET = [
+    ["QnA ID", "Category", "Question", "Answer", "Keywords"],
+    ["Q1", "Electrical", "What do I do when the power trips?", "Reset the DB box.", "trip, db box"],
+    ["Q2", "Internet", "The wifi is not working", "Restart the router.", "wifi, router"],
+    ["Q3", "Short row"],
+]
+
+
+def test_qna_index_is_reused_for_the_same_sheet_data_and_rebuilt_for_new_data():
+    client = _client(_qna_index_cache={})
+
+    index = client._get_qna_index("sid", QNA_SHEET)
+
+    assert client._get_qna_index("sid", QNA_SHEET) is index
+    assert [row[2] for row in index["rows"]] == ["what do i do when the power trips?", "the wifi is not working"]
+    assert client._get_qna_index("sid", list(QNA_SHEET)) is not index
+
+
+def test_search_sheet_qna_memoizes_results_per_query():
+    client = _client(_qna_index_cache={})
+
+    match = client._search_sheet_qna(QNA_SHEET, "Wifi not working", sheet_id="sid")
+
+    assert match["qna_id"] == "Q2"
+    assert match["answer"] == "Restart the router."
+    assert client._qna_index_cache["sid"]["results"]["wifi not working"] is match
+    assert client._search_sheet_qna(QNA_SHEET, "WIFI NOT WORKING", sheet_id="sid") is match
+
+
+def _throttled_client(rate_per_min, burst):
+    return _client(
+        write_rate_per_min=rate_per_min,
+        write_burst=burst,
+        _write_throttle_lock=threading.Lock(),
+        _write_tokens=burst,
+        _write_tokens_at=time.monotonic(),
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(gsc.time, "sleep", calls.append)
+    return calls
+
+
+def test_throttle_write_lets_a_burst_through_then_spaces_writes_at_the_rate(sleeps):
+    client = _throttled_client(rate_per_min=60, burst=3)
+
+    for _ in range(5):
+        client._throttle_write()
+
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(1.0, abs=0.05)
+    assert sleeps[1] == pytest.approx(2.0, abs=0.05)
+
+
+def test_throttle_write_refills_up_to_the_burst_only(sleeps):
+    client = _throttled_client(rate_per_min=60, burst=2)
+    client._write_tokens = 0
+    client._write_tokens_at = time.monotonic() - 600
+
+    for _ in range(3):
+        client._throttle_write()
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(1.0, abs=0.05)
+
+
+def test_throttle_write_is_off_when_rate_is_not_positive(sleeps):
+    client = _throttled_client(rate_per_min=0, burst=1)
+
+    for _ in range(10):
+        client._throttle_write()
+
+    assert sleeps == []
+
+
+def test_bulk_update_cells_reports_landed_and_failed_chunks():
+    client = _client(
+        max_workers=4, _pool=None, _pool_lock=threading.Lock(),
+        **_throttled_client(rate_per_min=0, burst=1).__dict__,
+    )
+    written = []
+
+    def batch_update(chunk, sheet_id=None):
+        ranges = [upd["range"] for upd in chunk]
+        if "S!A3:B3" in ranges:
+            return False
+        written.extend(ranges)
+        return True
+
+    client.batch_update = batch_update
+    updates = [{"sheet_name": "S", "row": r, "col": c, "value": r * c} for r in range(1, 6) for c in (1, 2)]
+    try:
+        result = client.bulk_update_cells(updates, chunk_size=2)
+    finally:
+        client._executor.shutdown(wait=True)
+
+    assert not result
+    assert "S!A3:B3" in result.failed_ranges
+    assert sorted(result.landed_ranges) == sorted(written)
+    assert sorted(result.landed_ranges + result.failed_ranges) == [f"S!A{r}:B{r}" for r in range(1, 6)]
+
+
+@pytest.mark.parametrize("rng, expected", [
+    ("Sheet1!A1", ("sheet1", 1, 1, 1, 1)),
+    ("Sheet1!B2:D10", ("sheet1", 2, 10, 2, 4)),
+    ("Sheet1!A:C", ("sheet1", 1, gsc._SPAN_MAX, 1, 3)),
+    ("Sheet1!3:5", ("sheet1", 3, 5, 1, gsc._SPAN_MAX)),
+    ("'It''s Data'!a1:b2", ("it's data", 1, 2, 1, 2)),
+])
+def test_a1_span(rng, expected):
+    assert gsc._a1_span(rng) == expected
+
+
+@pytest.mark.parametrize("rng", ["Sheet1", "A1:B2", "Sheet1!not a range"])
+def test_a1_span_is_none_when_the_range_cannot_be_told(rng):
+    assert gsc._a1_span(rng) is None
+
+
+def test_spans_overlap():
+    written = [gsc._a1_span("Sheet1!B2:C3")]
+
+    assert gsc._spans_overlap(gsc._a1_span("Sheet1!C3:D4"), written)
+    assert gsc._spans_overlap(gsc._a1_span("Sheet1!A:B"), written)
+    assert gsc._spans_overlap(None, written)
+    assert not gsc._spans_overlap(gsc._a1_span("Sheet1!D1:E9"), written)
+    assert not gsc._spans_overlap(gsc._a1_span("Sheet1!A4:Z9"), written)
+    assert not gsc._spans_overlap(gsc._a1_span("Other!B2:C3"), written)
+
+
+def _cached_client():
+    client = _client(
+        cache_ttl=60, cache_max_entries=100,
+        _data_cache=OrderedDict(), _cache_index={}, _cache_lock=threading.Lock(),
+        _config_cache={}, _config_lock=threading.Lock(), _find_row_index={},
+    )
+    client._cache_put("sid", "a", [["a"]], "Sheet1!A1:B5")
+    client._cache_put("sid", "b", [["b"]], "Sheet1!D1:D5")
+    client._cache_put("sid", "c", [["c"]], "Other!A1:B5")
+    client._cache_put("other-sid", "d", [["d"]], "Sheet1!A1:B5")
+    client._config_cache["sid"] = {"Sheet1": (0, {}, {}), "Config": (0, {}, {})}
+    return client
+
+
+def test_invalidate_ranges_drops_only_overlapping_reads_of_that_sheet():
+    client = _cached_client()
+
+    client._invalidate_ranges("sid", ["Sheet1!B3"])
+
+    assert set(client._data_cache) == {"b", "c", "d"}
+    assert client._cache_index["sid"] == {"b", "c"}
+    assert set(client._config_cache["sid"]) == {"Config"}
+
+
+def test_invalidate_ranges_drops_the_whole_sheet_when_a_range_is_unclear():
+    client = _cached_client()
+
+    client._invalidate_ranges("sid", ["Sheet1!B3", "A1:B2"])
+
+    assert set(client._data_cache) == {"d"}
+    assert "sid" not in client._cache_index
+    assert "sid" not in client._config_cache
+
+
+def _cells(sheet, rows, cols):
+    return {(sheet, r, c): f"{r}/{c}" for r in rows for c in cols}
+
+
+def test_coalesce_cell_updates_merges_adjacent_cells_into_rectangles():
+    client = _client()
+    cells = {**_cells("S", range(1, 4), range(1, 3)), **_cells("S", [7], [5]), **_cells("T", [1], [1, 2])}
+
+    merged = client._coalesce_cell_updates(cells)
+
+    assert merged == [
+        {"range": "S!A1:B3", "values": [["1/1", "1/2"], ["2/1", "2/2"], ["3/1", "3/2"]]},
+        {"range": "S!E7", "values": [["7/5"]]},
+        {"range": "T!A1:B1", "values": [["1/1", "1/2"]]},
+    ]
+
+
+def test_coalesce_cell_updates_keeps_gaps_and_ragged_rows_apart():
+    client = _client()
+    cells = {**_cells("S", [1], [1, 2, 4]), **_cells("S", [2], [1, 2, 3]), **_cells("S", [4], [1, 2])}
+
+    ranges = [upd["range"] for upd in client._coalesce_cell_updates(cells)]
+
+    assert ranges == ["S!A1:B1", "S!D1", "S!A2:C2", "S!A4:B4"]
+
+
+def test_coalesce_cell_updates_caps_each_range_at_max_cells():
+    client = _client()
+
+    merged = client._coalesce_cell_updates(_cells("S", range(1, 6), range(1, 5)), max_cells=8)
+
+    assert [upd["range"] for upd in merged] == ["S!A1:D2", "S!A3:D4", "S!A5:D5"]
+    assert all(sum(len(row) for row in upd["values"]) <= 8 for upd in merged)
+    assert len(client._coalesce_cell_updates(_cells("S", [1], range(1, 8)), max_cells=3)) == 3
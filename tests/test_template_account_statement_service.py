@@ -0,0 +1,107 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("requests")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Functions"))
+
+from template_account_statement_service import (  # noqa: E402
+    TemplateAccountStatementService,
+    _date_sort_key,
+    _group_by_contract,
+    _split_address,
+)
+
+
+def _number_values(request):
+    for row in request["updateCells"]["rows"]:
+        for cell in row["values"]:
+            value = cell.get("userEnteredValue", {})
+            if "numberValue" in value:
+                yield value["numberValue"]
+
+
+def test_single_template_sends_only_real_numbers_as_number_values():
+    service = TemplateAccountStatementService(sheets_client=None, drive_client=None)
+    captured = {}
+    service.apply_template_fill = lambda **kwargs: captured.update(kwargs) or True
+
+    service.fill_single_template(
+        spreadsheet_id="working-copy",
+        contract_info={
+            "contract_id": "C-1001",
+            "customer_name": "Jane Tan",
+            "customer_code": "CUST-9",
+            "email": "jane@example.com",
+            "start_date": "2024-01-01",
+            "end_date": "2024-12-31",
+        },
+        summary_data={"total_invoiced": "RM 7,065.28", "total_paid": "RM 1,000.00", "outstanding": "RM 6,065.28"},
+        detail_data=[
+            {"invoice no.": "INV-1", "receipt no.": "RCP-1", "month": "2024-01-01", "debit": "1000.00",
+             "credit": "1000.00", "payment status": "Paid", "paid at": "2024-01-05"},
+            {"invoice no.": "INV-2", "receipt no.": "-", "month": "2024-02-01", "debit": "6065.28",
+             "credit": "", "payment status": "Unpaid", "paid at": ""},
+        ],
+        point_data=[{"invoice_number": "INV-1", "points": 12.5}],
+        total_planet_points=12.5,
+    )
+
+    assert captured, "fill_single_template did not reach apply_template_fill"
+    requests_list = [
+        service._values_request(0, upd["range"], upd["values"], upd.get("cells")) for upd in captured["updates"]
+    ]
+    numbers = [n for request in requests_list for n in _number_values(request)]
+
+    assert numbers
+    for n in numbers:
+        assert isinstance(n, (int, float)) and not isinstance(n, bool), n
+
+
+def test_split_address_prefers_five_digit_postcode_over_earlier_six_digit_token():
+    line1, line2, line3 = _split_address("Unit 123456, Jalan Ampang, 50450 Kuala Lumpur")
+
+    assert line3 == "50450"
+    assert line1 == "Unit 123456"
+    assert line2 == "Jalan Ampang, Kuala Lumpur"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("05/03/2024", (2024, 3, 5)),
+    ("5/3/2024", (2024, 3, 5)),
+    ("29/02/2024", (2024, 2, 29)),
+    ("31/12/2023", (2023, 12, 31)),
+])
+def test_date_sort_key_parses_dd_mm_yyyy(value, expected):
+    assert _date_sort_key(value) == expected
+
+
+@pytest.mark.parametrize("value", ["31/02/2024", "29/02/2023", "31/04/2024", "00/01/2024", "01/13/2024",
+                                   "2024-03-05", "", "-"])
+def test_date_sort_key_sends_invalid_dates_first(value):
+    assert _date_sort_key(value) == (0, 0, 0)
+
+
+def test_date_sort_key_orders_chronologically_across_years():
+    dates = ["01/02/2024", "15/12/2023", "31/02/2024", "02/01/2024"]
+
+    assert sorted(dates, key=_date_sort_key) == ["31/02/2024", "15/12/2023", "02/01/2024", "01/02/2024"]
+
+
+def test_group_by_contract_matches_ids_ignoring_case_and_whitespace():
+    details = [
+        {"contract id": " c-1001 ", "invoice no.": "INV-1"},
+        {"contract id": "C-1002", "invoice no.": "INV-2"},
+        {"contract id": "C-1001", "invoice no.": "INV-3"},
+        {"contract id": "C-9999", "invoice no.": "INV-4"},
+        {"invoice no.": "INV-5"},
+    ]
+
+    grouped = _group_by_contract(details, ["C-1001", "C-1002", "C-1003"])
+
+    assert list(grouped) == ["C-1001", "C-1002", "C-1003"]
+    assert [d["invoice no."] for d in grouped["C-1001"]] == ["INV-1", "INV-3"]
+    assert [d["invoice no."] for d in grouped["C-1002"]] == ["INV-2"]
+    assert grouped["C-1003"] == []